@@ -179,6 +179,8 @@ class GeneWebValidationError(GeneWebError):
         self.entity_type = kwargs.get("entity_type", None)
         self.entity_id = kwargs.get("entity_id", None)
         self.person_id = kwargs.get("person_id", None)
+        # Code stable (ex. "NO_SPOUSE") pour tester l'erreur sans formater le message
+        self.error_code = kwargs.get("error_code", None)
         self.validation_errors = kwargs.get("validation_errors", []) or []
         self.context = context
         # Filtrer les kwargs déjà consommés pour éviter les doublons
@@ -190,6 +192,7 @@ class GeneWebValidationError(GeneWebError):
                 "entity_type",
                 "entity_id",
                 "person_id",
+                "error_code",
                 "validation_errors",
                 "field",
                 "value",
@@ -240,6 +243,7 @@ class GeneWebValidationError(GeneWebError):
                 "value": self.value,
                 "entity_type": self.entity_type,
                 "entity_id": self.entity_id,
+                "error_code": self.error_code,
             }
         )
         return result
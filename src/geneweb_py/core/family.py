@@ -5,9 +5,20 @@ Ce module définit la représentation des unités familiales avec époux,
 enfants et événements familiaux.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from .date import Date
 from .event import EventType, FamilyEvent, FamilyEventType
@@ -15,6 +26,24 @@ from .event import EventType, FamilyEvent, FamilyEventType
 if TYPE_CHECKING:
     pass
 
+# __slots__ générés par dataclass : pas de __dict__ par instance (Python >= 3.10)
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# Codes des erreurs de validation levées par Family (cf. validation_error_codes)
+NO_SPOUSE = "NO_SPOUSE"
+MARRIAGE_AFTER_DIVORCE = "MARRIAGE_AFTER_DIVORCE"
+
+# Correspondance EventType -> FamilyEventType (cf. Family.get_events_by_type)
+_FAMILY_EVENT_TYPES: Dict[EventType, FamilyEventType] = {
+    EventType.MARRIAGE: FamilyEventType.MARRIAGE,
+    EventType.DIVORCE: FamilyEventType.DIVORCE,
+    EventType.SEPARATION: FamilyEventType.SEPARATION,
+    EventType.ENGAGEMENT: FamilyEventType.ENGAGEMENT,
+    EventType.PACS: FamilyEventType.PACS,
+}
+
 
 class MarriageStatus(Enum):
     """Statut du mariage/relation"""
@@ -36,7 +65,7 @@ class ChildSex(Enum):
     UNKNOWN = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Child:
     """Représentation d'un enfant dans une famille"""
 
@@ -44,6 +73,11 @@ class Child:
     sex: ChildSex = ChildSex.UNKNOWN
     last_name: Optional[str] = None  # Si différent du père
 
+    def __post_init__(self) -> None:
+        """Partage la chaîne d'identifiant avec les clés de Genealogy.persons"""
+        if isinstance(self.person_id, str):
+            self.person_id = sys.intern(self.person_id)
+
     def __str__(self) -> str:
         """Représentation string de l'enfant"""
         parts = []
@@ -59,7 +93,7 @@ class Child:
         return " ".join(parts)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Family:
     """Représentation d'une famille dans la généalogie
 
@@ -115,8 +149,16 @@ class Family:
         default_factory=list
     )  # List[GeneWebError] mais évite import circulaire
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Validation après initialisation"""
+        # Identifiants internés : mêmes objets que les clés de Genealogy
+        if isinstance(self.family_id, str):
+            self.family_id = sys.intern(self.family_id)
+        if isinstance(self.husband_id, str):
+            self.husband_id = sys.intern(self.husband_id)
+        if isinstance(self.wife_id, str):
+            self.wife_id = sys.intern(self.wife_id)
+
         # Vérifier qu'au moins un époux est défini (validation gracieuse)
         if not self.husband_id and not self.wife_id:
             from .exceptions import GeneWebValidationError
@@ -126,22 +168,26 @@ class Family:
                 field="husband_id/wife_id",
                 entity_type="Family",
                 entity_id=self.family_id,
+                error_code=NO_SPOUSE,
             )
             self.add_validation_error(error)
 
-        # Validation gracieuse des dates
-        if self.marriage_date and self.divorce_date:
-            if self.marriage_date.year and self.divorce_date.year:
-                if self.marriage_date.year > self.divorce_date.year:
-                    from .exceptions import GeneWebValidationError
+        # Validation gracieuse des dates : rien à comparer sans les deux dates
+        if self.marriage_date is None or self.divorce_date is None:
+            return
+        marriage_year = self.marriage_date.year
+        divorce_year = self.divorce_date.year
+        if marriage_year and divorce_year and marriage_year > divorce_year:
+            from .exceptions import GeneWebValidationError
 
-                    error = GeneWebValidationError(
-                        f"Date de mariage ({self.marriage_date}) postérieure à la date de divorce ({self.divorce_date})",  # noqa: E501
-                        field="marriage_date",
-                        entity_type="Family",
-                        entity_id=self.family_id,
-                    )
-                    self.add_validation_error(error)
+            error = GeneWebValidationError(
+                f"Date de mariage ({self.marriage_date}) postérieure à la date de divorce ({self.divorce_date})",  # noqa: E501
+                field="marriage_date",
+                entity_type="Family",
+                entity_id=self.family_id,
+                error_code=MARRIAGE_AFTER_DIVORCE,
+            )
+            self.add_validation_error(error)
 
     @property
     def spouse_ids(self) -> List[str]:
@@ -161,7 +207,28 @@ class Family:
     @property
     def all_member_ids(self) -> List[str]:
         """Retourne tous les membres de la famille"""
-        return self.spouse_ids + self.child_ids
+        # Une seule liste : spouse_ids est déjà une copie neuve, on l'étend
+        members = self.spouse_ids
+        members.extend(child.person_id for child in self.children)
+        return members
+
+    @property
+    def member_id_set(self) -> FrozenSet[str]:
+        """Retourne l'ensemble des IDs des membres (époux et enfants)
+
+        À privilégier pour tester l'appartenance de nombreuses personnes à la
+        même famille : l'ensemble est construit une fois, chaque test est O(1).
+        """
+        return frozenset(self.all_member_ids)
+
+    @property
+    def validation_error_codes(self) -> FrozenSet[str]:
+        """Retourne les codes des erreurs de validation (ex. ``NO_SPOUSE``)
+
+        Permet un test d'appartenance direct sans formater chaque message.
+        """
+        codes = (getattr(error, "error_code", None) for error in self.validation_errors)
+        return frozenset(code for code in codes if code)
 
     @property
     def is_married(self) -> bool:
@@ -194,6 +261,16 @@ class Family:
         child = Child(person_id=person_id, sex=sex, last_name=last_name)
         self.children.append(child)
 
+    def extend_children(self, items: Iterable[Tuple[str, ChildSex]]) -> None:
+        """Ajoute plusieurs enfants en une seule opération
+
+        Args:
+            items: Couples (ID de la personne enfant, sexe de l'enfant)
+        """
+        self.children.extend(
+            [Child(person_id=person_id, sex=sex) for person_id, sex in items]
+        )
+
     def remove_child(self, person_id: str) -> bool:
         """Retire un enfant de la famille
 
@@ -223,6 +300,10 @@ class Family:
         """Ajoute un événement familial"""
         self.events.append(event)
 
+    def extend_events(self, events: Iterable[FamilyEvent]) -> None:
+        """Ajoute plusieurs événements familiaux en une seule opération"""
+        self.events.extend(events)
+
     def add_comment(self, comment: str) -> None:
         """Ajoute un commentaire à la famille"""
         self.comments.append(comment)
@@ -233,26 +314,17 @@ class Family:
         """Retourne tous les événements d'un type donné"""
         if isinstance(event_type, EventType):
             # Convertir EventType vers FamilyEventType si possible
-            type_mapping = {
-                EventType.MARRIAGE: FamilyEventType.MARRIAGE,
-                EventType.DIVORCE: FamilyEventType.DIVORCE,
-                EventType.SEPARATION: FamilyEventType.SEPARATION,
-                EventType.ENGAGEMENT: FamilyEventType.ENGAGEMENT,
-                EventType.PACS: FamilyEventType.PACS,
-            }
-            family_event_type = type_mapping.get(event_type)
-            if family_event_type:
-                return [
-                    event
-                    for event in self.events
-                    if event.family_event_type == family_event_type
-                ]
+            family_event_type = _FAMILY_EVENT_TYPES.get(event_type)
+            if family_event_type is None:
+                return []
         else:
-            return [
-                event for event in self.events if event.family_event_type == event_type
-            ]
+            family_event_type = event_type
 
-        return []
+        return [
+            event
+            for event in self.events
+            if event.family_event_type == family_event_type
+        ]
 
     def spouse(self, person_id: str) -> Optional[str]:
         """Retourne l'ID du conjoint d'une personne donnée
@@ -278,7 +350,10 @@ class Family:
         Returns:
             True si la personne est époux(se) dans cette famille
         """
-        return person_id in self.spouse_ids
+        # Comparaison directe, sans construire la liste spouse_ids
+        if not person_id:
+            return False
+        return person_id in (self.husband_id, self.wife_id)
 
     def is_child(self, person_id: str) -> bool:
         """Vérifie si une personne est enfant dans cette famille
@@ -289,7 +364,7 @@ class Family:
         Returns:
             True si la personne est enfant dans cette famille
         """
-        return person_id in self.child_ids
+        return any(child.person_id == person_id for child in self.children)
 
     def is_member(self, person_id: str) -> bool:
         """Vérifie si une personne est membre de cette famille
@@ -349,13 +424,7 @@ class Family:
 
     def __str__(self) -> str:
         """Représentation string de la famille"""
-        spouses = []
-        if self.husband_id:
-            spouses.append(self.husband_id)
-        if self.wife_id:
-            spouses.append(self.wife_id)
-
-        spouse_str = " + ".join(spouses)
+        spouse_str = " + ".join(self.spouse_ids)
         child_count = len(self.children)
 
         return f"Family({spouse_str}) - {child_count} enfants"
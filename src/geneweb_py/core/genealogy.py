@@ -5,16 +5,22 @@ Ce module définit la classe principale qui regroupe toutes les personnes,
 familles et métadonnées d'une base généalogique GeneWeb.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from .exceptions import GeneWebError, GeneWebValidationError
 from .family import Family
 from .person import Person
 
+# __slots__ générés par dataclass : pas de __dict__ par instance (Python >= 3.10)
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class GenealogyMetadata:
     """Métadonnées de la base généalogique"""
 
@@ -38,7 +44,7 @@ class GenealogyMetadata:
     wizard_notes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Genealogy:
     """Conteneur principal pour toutes les données généalogiques
 
@@ -77,7 +83,8 @@ class Genealogy:
         Raises:
             GeneWebValidationError: Si la personne existe déjà
         """
-        person_id = person.unique_id
+        # Clé internée : même objet que les identifiants portés par Family/Child
+        person_id = sys.intern(person.unique_id)
 
         if person_id in self.persons:
             raise GeneWebValidationError(
@@ -87,6 +94,30 @@ class Genealogy:
         self.persons[person_id] = person
         self._invalidate_stats_cache()
 
+    def extend_persons(self, persons: Iterable[Person]) -> None:
+        """Ajoute plusieurs personnes en une seule opération
+
+        Les doublons (déjà présents ou répétés dans le lot) sont détectés avant
+        toute insertion : en cas d'erreur, la généalogie reste inchangée.
+
+        Args:
+            persons: Personnes à ajouter
+
+        Raises:
+            GeneWebValidationError: Si une personne existe déjà
+        """
+        batch: Dict[str, Person] = {}
+        for person in persons:
+            person_id = sys.intern(person.unique_id)
+            if person_id in self.persons or person_id in batch:
+                raise GeneWebValidationError(
+                    f"Personne '{person_id}' déjà présente dans la généalogie"
+                )
+            batch[person_id] = person
+
+        self.persons.update(batch)
+        self._invalidate_stats_cache()
+
     def add_or_update_person(self, person: Person) -> Person:
         """Ajoute une personne ou met à jour si elle existe déjà
 
@@ -100,7 +131,7 @@ class Genealogy:
         Returns:
             La personne ajoutée ou mise à jour (référence existante si doublon)
         """
-        person_id = person.unique_id
+        person_id = sys.intern(person.unique_id)
 
         if person_id in self.persons:
             # La personne existe déjà, fusionner les informations
@@ -164,6 +195,11 @@ class Genealogy:
     def add_family(self, family: Family) -> None:
         """Ajoute une famille à la généalogie
 
+        Les époux et enfants déjà présents sont reliés à la famille en un seul
+        parcours de ``family.children`` : compléter la famille (``add_child``)
+        avant de l'ajouter. Une famille modifiée après coup n'est reliée à
+        nouveau que par ``_update_cross_references``.
+
         Args:
             family: Famille à ajouter
 
@@ -176,6 +212,33 @@ class Genealogy:
             )
 
         self.families[family.family_id] = family
+        self._link_family(family)
+        self._invalidate_stats_cache()
+
+    def extend_families(self, families: Iterable[Family]) -> None:
+        """Ajoute plusieurs familles en une seule opération
+
+        Les doublons (déjà présents ou répétés dans le lot) sont détectés avant
+        toute insertion : en cas d'erreur, la généalogie reste inchangée.
+
+        Args:
+            families: Familles à ajouter
+
+        Raises:
+            GeneWebValidationError: Si une famille existe déjà
+        """
+        batch: Dict[str, Family] = {}
+        for family in families:
+            family_id = family.family_id
+            if family_id in self.families or family_id in batch:
+                raise GeneWebValidationError(
+                    f"Famille '{family_id}' déjà présente dans la généalogie"
+                )
+            batch[family_id] = family
+
+        self.families.update(batch)
+        for family in batch.values():
+            self._link_family(family)
         self._invalidate_stats_cache()
 
     def find_person(
@@ -283,18 +346,26 @@ class Genealogy:
         Returns:
             Liste des frères et sœurs
         """
-        siblings = []
+        return list(self.iter_siblings(person_id))
+
+    def iter_siblings(self, person_id: str) -> Iterator[Person]:
+        """Itère sur les frères et sœurs d'une personne sans construire de liste
 
+        Args:
+            person_id: ID de la personne
+
+        Yields:
+            Frères et sœurs présents dans la généalogie
+        """
         for family in self.families.values():
             if family.is_child(person_id):
-                for sibling_id in family.child_ids:
+                for child in family.children:
+                    sibling_id = child.person_id
                     if sibling_id != person_id:
-                        sibling = self.find_person_by_id(sibling_id)
+                        sibling = self.persons.get(sibling_id)
                         if sibling:
-                            siblings.append(sibling)
-                break
-
-        return siblings
+                            yield sibling
+                return
 
     def get_spouses(self, person_id: str) -> List[Person]:
         """Retourne tous les conjoints d'une personne
@@ -308,12 +379,12 @@ class Genealogy:
         spouses = []
 
         for family in self.families.values():
-            if family.is_parent(person_id):
-                spouse_id = family.spouse(person_id)
-                if spouse_id:
-                    spouse = self.find_person_by_id(spouse_id)
-                    if spouse:
-                        spouses.append(spouse)
+            # spouse() renvoie None si la personne n'est pas époux(se) ici
+            spouse_id = family.spouse(person_id)
+            if spouse_id:
+                spouse = self.persons.get(spouse_id)
+                if spouse:
+                    spouses.append(spouse)
 
         return spouses
 
@@ -434,44 +505,52 @@ class Genealogy:
         return self._stats_cache.copy()
 
     def _calculate_stats(self) -> None:
-        """Calcule et met en cache les statistiques"""
-        stats = {
+        """Calcule et met en cache les statistiques (un seul parcours)"""
+        living = deceased = unknown_status = 0
+        with_birth = with_death = 0
+        by_gender = {"m": 0, "f": 0, "?": 0}
+        ages = []
+
+        for person in self.persons.values():
+            if person.is_alive:
+                living += 1
+            else:
+                deceased += 1
+            if person.is_deceased is None:
+                unknown_status += 1
+            if person.birth_date:
+                with_birth += 1
+            if person.death_date:
+                with_death += 1
+            by_gender[person.gender.value] += 1
+
+            age = person.age_at_death
+            if age is not None:
+                ages.append(age)
+
+        with_children = total_children = 0
+        for family in self.families.values():
+            if family.children:
+                with_children += 1
+                total_children += len(family.children)
+
+        stats: Dict[str, Any] = {
             "total_persons": len(self.persons),
             "total_families": len(self.families),
-            "living_persons": sum(1 for p in self.persons.values() if p.is_alive),
-            "deceased_persons": sum(1 for p in self.persons.values() if not p.is_alive),
-            "unknown_status_persons": sum(
-                1 for p in self.persons.values() if p.is_deceased is None
-            ),
-            "persons_with_birth_date": sum(
-                1 for p in self.persons.values() if p.birth_date
-            ),
-            "persons_with_death_date": sum(
-                1 for p in self.persons.values() if p.death_date
-            ),
-            "families_with_children": sum(
-                1 for f in self.families.values() if f.children
-            ),
-            "total_children": sum(len(f.children) for f in self.families.values()),
+            "living_persons": living,
+            "deceased_persons": deceased,
+            "unknown_status_persons": unknown_status,
+            "persons_with_birth_date": with_birth,
+            "persons_with_death_date": with_death,
+            "families_with_children": with_children,
+            "total_children": total_children,
+            # Statistiques par sexe
+            "male_persons": by_gender["m"],
+            "female_persons": by_gender["f"],
+            "unknown_gender_persons": by_gender["?"],
         }
 
-        # Statistiques par sexe
-        stats["male_persons"] = sum(
-            1 for p in self.persons.values() if p.gender.value == "m"
-        )
-        stats["female_persons"] = sum(
-            1 for p in self.persons.values() if p.gender.value == "f"
-        )
-        stats["unknown_gender_persons"] = sum(
-            1 for p in self.persons.values() if p.gender.value == "?"
-        )
-
         # Âges
-        ages = []
-        for person in self.persons.values():
-            if person.age_at_death is not None:
-                ages.append(person.age_at_death)
-
         if ages:
             stats["average_age_at_death"] = sum(ages) / len(ages)
             stats["oldest_death"] = max(ages)
@@ -484,29 +563,31 @@ class Genealogy:
         self._stats_cache = {}
 
     def _update_cross_references(self) -> None:
-        """Met à jour les références croisées entre personnes et familles"""
-        # Mettre à jour les références des personnes vers les familles
+        """Reconstruit les références croisées entre personnes et familles
+
+        ``add_family`` les tient déjà à jour ; la reconstruction complète ne sert
+        qu'aux chargements où des familles sont ajoutées avant leurs membres.
+        """
         for person in self.persons.values():
             person.families_as_child.clear()
             person.families_as_spouse.clear()
 
         for family in self.families.values():
-            # Mettre à jour les références des époux
-            if family.husband_id:
-                husband = self.find_person_by_id(family.husband_id)
-                if husband:
-                    husband.families_as_spouse.append(family.family_id)
-
-            if family.wife_id:
-                wife = self.find_person_by_id(family.wife_id)
-                if wife:
-                    wife.families_as_spouse.append(family.family_id)
-
-            # Mettre à jour les références des enfants
-            for child_id in family.child_ids:
-                child = self.find_person_by_id(child_id)
-                if child:
-                    child.families_as_child.append(family.family_id)
+            self._link_family(family)
+
+    def _link_family(self, family: Family) -> None:
+        """Référence une famille depuis ses époux et ses enfants déjà présents"""
+        family_id = family.family_id
+
+        for spouse_id in (family.husband_id, family.wife_id):
+            spouse = self.persons.get(spouse_id) if spouse_id else None
+            if spouse and family_id not in spouse.families_as_spouse:
+                spouse.families_as_spouse.append(family_id)
+
+        for child_id in family.child_ids:
+            child = self.persons.get(child_id)
+            if child and family_id not in child.families_as_child:
+                child.families_as_child.append(family_id)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convertit la généalogie en dictionnaire pour sérialisation"""
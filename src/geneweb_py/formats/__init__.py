@@ -6,6 +6,7 @@ entre différents formats :
 - GEDCOM (export et import)
 - JSON (export et import)
 - XML (export et import)
+- MessagePack (export et import binaires, extra optionnel [msgpack])
 - Autres formats généalogiques
 
 Classes principales :
@@ -15,11 +16,14 @@ Classes principales :
 - JSONImporter : Import depuis format JSON
 - XMLExporter : Export vers format XML
 - XMLImporter : Import depuis format XML
+- MsgpackExporter : Export vers format MessagePack
+- MsgpackImporter : Import depuis format MessagePack
 """
 
 from .base import BaseExporter, BaseImporter, ConversionError
 from .gedcom import GEDCOMExporter, GEDCOMImporter
 from .json import JSONExporter, JSONImporter
+from .msgpack import MsgpackExporter, MsgpackImporter
 from .xml import XMLExporter, XMLImporter
 
 __all__ = [
@@ -36,4 +40,7 @@ __all__ = [
     # XML
     "XMLExporter",
     "XMLImporter",
+    # MessagePack
+    "MsgpackExporter",
+    "MsgpackImporter",
 ]
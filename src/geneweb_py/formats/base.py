@@ -5,13 +5,16 @@ Ce module définit les interfaces communes pour tous les exporteurs et importeur
 de formats généalogiques.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, TypeVar, Union, cast
 
 from ..core.exceptions import GeneWebConversionError
 from ..core.genealogy import Genealogy
 
+_TextT = TypeVar("_TextT", bound=Optional[str])
+
 
 class ConversionError(GeneWebConversionError):
     """Exception levée lors d'erreurs de conversion de formats."""
@@ -156,3 +159,22 @@ class BaseImporter(ABC):
             raise ConversionError(f"Le chemin n'est pas un fichier : {path}")
 
         return path
+
+    @staticmethod
+    def _intern(value: _TextT) -> _TextT:
+        """
+        Interne une chaîne très répétée (noms, lieux) lue lors d'un import.
+
+        Les doublons d'une grande généalogie (milliers de DUPONT, mêmes
+        communes) partagent alors un seul objet en mémoire.
+
+        Args:
+            value: Chaîne à interner (toute valeur non-str est rendue telle
+                quelle, ex. ``None`` ou un nombre issu d'un JSON peu typé)
+
+        Returns:
+            La chaîne internée
+        """
+        if isinstance(value, str):
+            return cast(_TextT, sys.intern(value))
+        return value
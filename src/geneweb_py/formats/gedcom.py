@@ -31,6 +31,26 @@ from ..core.genealogy import Genealogy
 from ..core.person import Gender, Person, Title
 from .base import BaseExporter, BaseImporter, ConversionError
 
+# Lignes fixes de l'en-tête GEDCOM, de part et d'autre du bloc DATE horodaté
+_HEADER_START: Tuple[str, ...] = (
+    "0 HEAD",
+    "1 GEDC",
+    "2 VERS 5.5.1",
+    "2 FORM LINEAGE-LINKED",
+    "1 CHAR UTF-8",
+    "1 SOUR geneweb-py",
+    "2 VERS 1.0.0",
+    "2 NAME geneweb-py",
+    "2 CORP geneweb-py",
+    "1 DATE",
+)
+_HEADER_END: Tuple[str, ...] = (
+    "1 FILE",
+    "1 GEDC",
+    "2 VERS 5.5.1",
+    "2 FORM LINEAGE-LINKED",
+)
+
 
 class GEDCOMExporter(BaseExporter):
     """Exporteur vers le format GEDCOM."""
@@ -124,24 +144,14 @@ class GEDCOMExporter(BaseExporter):
 
     def _generate_header(self) -> List[str]:
         """Génère l'en-tête GEDCOM."""
-        lines = []
-        lines.append("0 HEAD")
-        lines.append("1 GEDC")
-        lines.append("2 VERS 5.5.1")
-        lines.append("2 FORM LINEAGE-LINKED")
-        lines.append("1 CHAR UTF-8")
-        lines.append("1 SOUR geneweb-py")
-        lines.append("2 VERS 1.0.0")
-        lines.append("2 NAME geneweb-py")
-        lines.append("2 CORP geneweb-py")
-        lines.append("1 DATE")
-        lines.append(f"2 TIME {datetime.now().strftime('%H:%M:%S')}")
-        lines.append(f"2 DATE {datetime.now().strftime('%d %b %Y')}")
-        lines.append("1 FILE")
-        lines.append("1 GEDC")
-        lines.append("2 VERS 5.5.1")
-        lines.append("2 FORM LINEAGE-LINKED")
-        return lines
+        # Seul l'horodatage varie : les lignes fixes sont précalculées
+        now = datetime.now()
+        return [
+            *_HEADER_START,
+            f"2 TIME {now.strftime('%H:%M:%S')}",
+            f"2 DATE {now.strftime('%d %b %Y')}",
+            *_HEADER_END,
+        ]
 
     def _export_person(self, person: Person) -> List[str]:
         """Exporte une personne vers le format GEDCOM."""
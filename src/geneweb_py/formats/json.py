@@ -7,8 +7,14 @@ et l'échange de données généalogiques.
 """
 
 import json
+import re
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, BinaryIO, Dict, Optional, Union
+
+try:  # Accélération optionnelle : pip install "geneweb-py[json]"
+    import orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None  # type: ignore[assignment]
 
 from ..core.date import Date
 from ..core.event import Event
@@ -17,6 +23,25 @@ from ..core.genealogy import Genealogy
 from ..core.person import Person
 from .base import BaseExporter, BaseImporter, ConversionError
 
+# Premier caractère significatif d'un document JSON (objet ou tableau)
+_JSON_START = re.compile(r"\s*[{\[]")
+
+# datetime, dataclasses et sous-classes de str/int/dict/list passent par
+# default=str comme avec json.dumps. Seules différences possibles, dans les
+# champs libres (Event.metadata, témoins) : une Enum est écrite par sa valeur
+# et la notation des flottants peut varier (1e16 contre 1e+16).
+_ORJSON_OPTIONS = (
+    (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    if orjson is not None
+    else 0
+)
+
 
 class JSONExporter(BaseExporter):
     """Exporteur vers le format JSON."""
@@ -58,6 +83,24 @@ class JSONExporter(BaseExporter):
         except Exception as e:
             raise ConversionError(f"Erreur lors de l'export JSON : {e}") from e
 
+    def export_to_stream(self, genealogy: Genealogy, stream: BinaryIO) -> None:
+        """
+        Exporte une généalogie vers un flux binaire (fichier ``wb``, ``BytesIO``).
+
+        Args:
+            genealogy: Objet Genealogy à exporter
+            stream: Flux binaire de sortie
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        json_content = self.export_to_string(genealogy)
+
+        try:
+            stream.write(json_content.encode(self.encoding))
+        except Exception as e:
+            raise ConversionError(f"Erreur lors de l'export JSON : {e}") from e
+
     def export_to_string(self, genealogy: Genealogy) -> str:
         """
         Exporte une généalogie vers une chaîne JSON.
@@ -75,6 +118,16 @@ class JSONExporter(BaseExporter):
 
         try:
             data = self._serialize_genealogy(genealogy)
+            # orjson ne sait indenter qu'à 2 espaces et n'échappe pas l'Unicode :
+            # il n'est utilisé qu'avec ces réglages (ceux par défaut)
+            if orjson is not None and self.indent == 2 and not self.ensure_ascii:
+                try:
+                    return orjson.dumps(
+                        data, default=str, option=_ORJSON_OPTIONS
+                    ).decode("utf-8")
+                except orjson.JSONEncodeError:
+                    # Entier de plus de 64 bits, etc. : json.dumps sait l'écrire
+                    pass
             return json.dumps(
                 data, indent=self.indent, ensure_ascii=self.ensure_ascii, default=str
             )
@@ -223,20 +276,43 @@ class JSONImporter(BaseImporter):
         path = self._validate_file_path(input_path)
 
         try:
-            with open(path, encoding=self.encoding) as f:
-                content = f.read()
+            return self.import_from_string(self._decode_input(path.read_bytes()))
 
-            return self.import_from_string(content)
+        except Exception as e:
+            raise ConversionError(f"Erreur lors de l'import JSON : {e}") from e
+
+    def import_from_stream(self, stream: BinaryIO) -> Genealogy:
+        """
+        Importe une généalogie depuis un flux binaire (fichier ``rb``, ``BytesIO``).
 
+        Args:
+            stream: Flux binaire contenant le document JSON
+
+        Returns:
+            Objet Genealogy importé
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        try:
+            content = self._decode_input(stream.read())
         except Exception as e:
             raise ConversionError(f"Erreur lors de l'import JSON : {e}") from e
 
-    def import_from_string(self, data: str) -> Genealogy:
+        return self.import_from_string(content)
+
+    def _decode_input(self, raw: bytes) -> Union[str, bytes]:
+        """Décode les octets lus, sauf en UTF-8 où ils vont tels quels au décodeur."""
+        if self.encoding.lower().replace("-", "") == "utf8":
+            return raw
+        return raw.decode(self.encoding)
+
+    def import_from_string(self, data: Union[str, bytes]) -> Genealogy:
         """
         Importe une généalogie depuis une chaîne JSON.
 
         Args:
-            data: Chaîne JSON à importer
+            data: Chaîne JSON à importer (ou octets UTF-8)
 
         Returns:
             Objet Genealogy importé
@@ -245,44 +321,51 @@ class JSONImporter(BaseImporter):
             ConversionError: En cas d'erreur de conversion
         """
         try:
+            # Rejet immédiat d'un texte qui ne peut pas être un document JSON
+            if isinstance(data, str) and not _JSON_START.match(data):
+                raise ValueError("le document ne commence pas par '{' ou '['")
+
             # Parser le JSON
-            json_data = json.loads(data)
+            json_data = orjson.loads(data) if orjson is not None else json.loads(data)
+            return self._build_genealogy(json_data)
 
-            # Vérifier que le JSON n'est pas vide
-            if not json_data or (not isinstance(json_data, dict)):
-                raise ConversionError("JSON vide ou invalide")
+        except Exception as e:
+            raise ConversionError(f"Erreur lors du parsing JSON : {e}") from e
 
-            # Vérifier qu'il y a au moins des données de généalogie
-            if not any(key in json_data for key in ["persons", "families", "metadata"]):
-                raise ConversionError(
-                    "JSON ne contient pas de données de généalogie valides"
-                )
+    def _build_genealogy(self, json_data: Any) -> Genealogy:
+        """Construit une généalogie depuis le document décodé (schéma JSON)."""
+        # Vérifier que le JSON n'est pas vide
+        if not json_data or (not isinstance(json_data, dict)):
+            raise ConversionError("JSON vide ou invalide")
 
-            # Réinitialiser les maps
-            self._person_map.clear()
-            self._family_map.clear()
+        # Vérifier qu'il y a au moins des données de généalogie
+        if not any(key in json_data for key in ["persons", "families", "metadata"]):
+            raise ConversionError(
+                "JSON ne contient pas de données de généalogie valides"
+            )
 
-            # Créer la généalogie
-            genealogy = Genealogy()
+        # Réinitialiser les maps
+        self._person_map.clear()
+        self._family_map.clear()
 
-            # Importer les personnes
-            if "persons" in json_data:
-                for person_data in json_data["persons"]:
-                    person = self._deserialize_person(person_data)
-                    if person:
-                        genealogy.add_person(person)
+        # Créer la généalogie
+        genealogy = Genealogy()
 
-            # Importer les familles
-            if "families" in json_data:
-                for family_data in json_data["families"]:
-                    family = self._deserialize_family(family_data)
-                    if family:
-                        genealogy.add_family(family)
+        # Importer les personnes
+        if "persons" in json_data:
+            for person_data in json_data["persons"]:
+                person = self._deserialize_person(person_data)
+                if person:
+                    genealogy.add_person(person)
 
-            return genealogy
+        # Importer les familles
+        if "families" in json_data:
+            for family_data in json_data["families"]:
+                family = self._deserialize_family(family_data)
+                if family:
+                    genealogy.add_family(family)
 
-        except Exception as e:
-            raise ConversionError(f"Erreur lors du parsing JSON : {e}") from e
+        return genealogy
 
     def _deserialize_person(self, data: Dict[str, Any]) -> Optional[Person]:
         """Désérialise une personne depuis un dictionnaire JSON."""
@@ -294,8 +377,8 @@ class JSONImporter(BaseImporter):
             )
 
             person = Person(
-                last_name=data.get("last_name", ""),
-                first_name=data.get("first_name", ""),
+                last_name=self._intern(data.get("last_name", "")),
+                first_name=self._intern(data.get("first_name", "")),
                 public_name=data.get("public_name"),
                 first_name_alias=data.get("first_name_alias"),
                 surname_alias=data.get("surname_alias"),
@@ -303,11 +386,11 @@ class JSONImporter(BaseImporter):
                 nickname=data.get("nickname"),
                 gender=gender,
                 birth_date=self._deserialize_date(data.get("birth_date")),
-                birth_place=data.get("birth_place"),
+                birth_place=self._intern(data.get("birth_place")),
                 death_date=self._deserialize_date(data.get("death_date")),
-                death_place=data.get("death_place"),
+                death_place=self._intern(data.get("death_place")),
                 baptism_date=self._deserialize_date(data.get("baptism_date")),
-                baptism_place=data.get("baptism_place"),
+                baptism_place=self._intern(data.get("baptism_place")),
                 occupation=data.get("occupation"),
             )
 
@@ -339,7 +422,7 @@ class JSONImporter(BaseImporter):
                 husband_id=data.get("husband_id"),
                 wife_id=data.get("wife_id"),
                 marriage_date=self._deserialize_date(data.get("marriage_date")),
-                marriage_place=data.get("marriage_place"),
+                marriage_place=self._intern(data.get("marriage_place")),
                 divorce_date=self._deserialize_date(data.get("divorce_date")),
                 witnesses=data.get("witnesses", []),
                 family_source=data.get("family_source"),
@@ -389,7 +472,7 @@ class JSONImporter(BaseImporter):
             event = Event(
                 event_type=event_type,
                 date=self._deserialize_date(data.get("date")),
-                place=data.get("place"),
+                place=self._intern(data.get("place")),
                 source=data.get("source"),
                 witnesses=data.get("witnesses", []),
                 notes=data.get("notes", []),
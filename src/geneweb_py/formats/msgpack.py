@@ -0,0 +1,207 @@
+"""
+Convertisseur MessagePack pour geneweb-py.
+
+Ce module fournit un export/import binaire reprenant exactement le schéma
+du format JSON (``metadata``, ``persons``, ``families``). Plus compact et
+plus rapide à (dé)coder que le texte JSON, il est destiné à la persistance
+et au rechargement de généalogies ; le JSON reste le format lisible.
+
+Nécessite l'extra optionnel : ``pip install "geneweb-py[msgpack]"``.
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Union
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    msgpack = None
+
+from ..core.genealogy import Genealogy
+from .base import ConversionError
+from .json import JSONExporter, JSONImporter
+
+_MISSING_MSGPACK = (
+    'Le format MessagePack requiert msgpack : pip install "geneweb-py[msgpack]"'
+)
+
+
+class MsgpackExporter(JSONExporter):
+    """Exporteur vers le format MessagePack (schéma identique au JSON)."""
+
+    def __init__(self, encoding: str = "utf-8"):
+        """
+        Initialise l'exporteur MessagePack.
+
+        Args:
+            encoding: Encodage des chaînes (défaut: utf-8)
+
+        Raises:
+            ImportError: Si msgpack n'est pas installé
+        """
+        if msgpack is None:
+            raise ImportError(_MISSING_MSGPACK)
+        super().__init__(encoding)
+
+    def export(self, genealogy: Genealogy, output_path: Union[str, Path]) -> None:
+        """
+        Exporte une généalogie vers un fichier MessagePack.
+
+        Args:
+            genealogy: Objet Genealogy à exporter
+            output_path: Chemin du fichier de sortie
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        payload = self.export_to_bytes(genealogy)
+
+        try:
+            Path(output_path).write_bytes(payload)
+        except Exception as e:
+            raise ConversionError(f"Erreur lors de l'export MessagePack : {e}") from e
+
+    def export_to_stream(self, genealogy: Genealogy, stream: BinaryIO) -> None:
+        """
+        Exporte une généalogie vers un flux binaire (fichier ``wb``, ``BytesIO``).
+
+        Args:
+            genealogy: Objet Genealogy à exporter
+            stream: Flux binaire de sortie
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        payload = self.export_to_bytes(genealogy)
+
+        try:
+            stream.write(payload)
+        except Exception as e:
+            raise ConversionError(f"Erreur lors de l'export MessagePack : {e}") from e
+
+    def export_to_bytes(self, genealogy: Genealogy) -> bytes:
+        """
+        Exporte une généalogie vers des octets MessagePack.
+
+        Args:
+            genealogy: Objet Genealogy à exporter
+
+        Returns:
+            Document MessagePack
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        self._validate_genealogy(genealogy)
+
+        try:
+            data = self._serialize_genealogy(genealogy)
+            packed: bytes = msgpack.packb(data, default=str)
+            return packed
+        except Exception as e:
+            raise ConversionError(
+                f"Erreur lors de la sérialisation MessagePack : {e}"
+            ) from e
+
+    def export_to_string(self, genealogy: Genealogy) -> str:
+        """
+        Non supporté : MessagePack est un format binaire.
+
+        Raises:
+            ConversionError: Toujours (utiliser ``export_to_bytes``)
+        """
+        raise ConversionError(
+            "MessagePack est un format binaire : utiliser export_to_bytes()"
+        )
+
+
+class MsgpackImporter(JSONImporter):
+    """Importeur depuis le format MessagePack (schéma identique au JSON)."""
+
+    def __init__(self, encoding: str = "utf-8"):
+        """
+        Initialise l'importeur MessagePack.
+
+        Args:
+            encoding: Encodage des chaînes (défaut: utf-8)
+
+        Raises:
+            ImportError: Si msgpack n'est pas installé
+        """
+        if msgpack is None:
+            raise ImportError(_MISSING_MSGPACK)
+        super().__init__(encoding)
+
+    def import_from_file(self, input_path: Union[str, Path]) -> Genealogy:
+        """
+        Importe une généalogie depuis un fichier MessagePack.
+
+        Args:
+            input_path: Chemin du fichier à importer
+
+        Returns:
+            Objet Genealogy importé
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        path = self._validate_file_path(input_path)
+
+        try:
+            content = path.read_bytes()
+        except Exception as e:
+            raise ConversionError(f"Erreur lors de l'import MessagePack : {e}") from e
+
+        return self.import_from_bytes(content)
+
+    def import_from_stream(self, stream: BinaryIO) -> Genealogy:
+        """
+        Importe une généalogie depuis un flux binaire (fichier ``rb``, ``BytesIO``).
+
+        Args:
+            stream: Flux binaire contenant le document MessagePack
+
+        Returns:
+            Objet Genealogy importé
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        try:
+            content = stream.read()
+        except Exception as e:
+            raise ConversionError(f"Erreur lors de l'import MessagePack : {e}") from e
+
+        return self.import_from_bytes(content)
+
+    def import_from_bytes(self, data: bytes) -> Genealogy:
+        """
+        Importe une généalogie depuis des octets MessagePack.
+
+        Args:
+            data: Document MessagePack
+
+        Returns:
+            Objet Genealogy importé
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        try:
+            decoded = msgpack.unpackb(data, raw=False)
+            return self._build_genealogy(decoded)
+        except Exception as e:
+            raise ConversionError(f"Erreur lors du parsing MessagePack : {e}") from e
+
+    def import_from_string(self, data: Union[str, bytes]) -> Genealogy:
+        """
+        Importe depuis des octets MessagePack (les chaînes ``str`` sont refusées).
+
+        Raises:
+            ConversionError: Si ``data`` n'est pas de type ``bytes``
+        """
+        if not isinstance(data, bytes):
+            raise ConversionError(
+                "MessagePack est un format binaire : utiliser import_from_bytes()"
+            )
+        return self.import_from_bytes(data)
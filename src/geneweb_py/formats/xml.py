@@ -6,17 +6,32 @@ le format XML pour faciliter l'intégration avec d'autres systèmes
 et l'échange de données généalogiques.
 """
 
+import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, BinaryIO, Dict, List, Optional, Union, cast
+
+try:  # Parsing durci (DTD et entités refusées) : pip install "geneweb-py[xml]"
+    from defusedxml.ElementTree import (  # type: ignore[import-untyped]
+        fromstring as _xml_fromstring,
+    )
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    _xml_fromstring = ET.fromstring
 
 from ..core.date import CalendarType, Date, DatePrefix, DeathType
 from ..core.event import Event, EventType, FamilyEvent, FamilyEventType, PersonalEvent
-from ..core.family import Family
+from ..core.family import _FAMILY_EVENT_TYPES, ChildSex, Family
 from ..core.genealogy import Genealogy
 from ..core.person import Person
 from .base import BaseExporter, BaseImporter, ConversionError
 
+# Premier caractère significatif d'un document XML (déclaration ou racine)
+_XML_START = re.compile(r"\s*<")
+
+# Code XML -> EventType, calculé une fois au chargement du module
+# (EventType -> FamilyEventType : table partagée _FAMILY_EVENT_TYPES de core.family)
+_EVENT_TYPE_BY_CODE: Dict[str, EventType] = {t.value: t for t in EventType}
+
 
 class XMLExporter(BaseExporter):
     """Exporteur vers le format XML."""
@@ -46,10 +61,32 @@ class XMLExporter(BaseExporter):
         self._validate_genealogy(genealogy)
 
         try:
-            xml_content = self.export_to_string(genealogy)
+            # Écriture directe de l'arbre dans le fichier, sans passer par
+            # la chaîne XML complète en mémoire
+            ET.ElementTree(self._build_tree(genealogy)).write(
+                output_path, encoding=self.encoding, xml_declaration=True
+            )
+
+        except Exception as e:
+            raise ConversionError(f"Erreur lors de l'export XML : {e}") from e
+
+    def export_to_stream(self, genealogy: Genealogy, stream: BinaryIO) -> None:
+        """
+        Exporte une généalogie vers un flux binaire (fichier ``wb``, ``BytesIO``).
+
+        Args:
+            genealogy: Objet Genealogy à exporter
+            stream: Flux binaire de sortie
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        self._validate_genealogy(genealogy)
 
-            with open(output_path, "w", encoding=self.encoding) as f:
-                f.write(xml_content)
+        try:
+            ET.ElementTree(self._build_tree(genealogy)).write(
+                stream, encoding=self.encoding, xml_declaration=True
+            )
 
         except Exception as e:
             raise ConversionError(f"Erreur lors de l'export XML : {e}") from e
@@ -70,10 +107,7 @@ class XMLExporter(BaseExporter):
         self._validate_genealogy(genealogy)
 
         try:
-            root = self._serialize_genealogy(genealogy)
-
-            if self.pretty_print:
-                self._indent_xml(root)
+            root = self._build_tree(genealogy)
 
             return cast(
                 str,
@@ -85,6 +119,35 @@ class XMLExporter(BaseExporter):
         except Exception as e:
             raise ConversionError(f"Erreur lors de la sérialisation XML : {e}") from e
 
+    def export_to_etree(self, genealogy: Genealogy) -> ET.Element:
+        """
+        Exporte une généalogie vers un arbre ElementTree (sans sérialisation).
+
+        Args:
+            genealogy: Objet Genealogy à exporter
+
+        Returns:
+            Élément racine ``<genealogy>``
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        self._validate_genealogy(genealogy)
+
+        try:
+            return self._build_tree(genealogy)
+        except Exception as e:
+            raise ConversionError(f"Erreur lors de la sérialisation XML : {e}") from e
+
+    def _build_tree(self, genealogy: Genealogy) -> ET.Element:
+        """Construit l'élément racine, indenté si ``pretty_print``."""
+        root = self._serialize_genealogy(genealogy)
+
+        if self.pretty_print:
+            self._indent_xml(root)
+
+        return root
+
     def _serialize_genealogy(self, genealogy: Genealogy) -> ET.Element:
         """Sérialise une généalogie en élément XML."""
         root = ET.Element("genealogy")
@@ -378,12 +441,34 @@ class XMLImporter(BaseImporter):
         except Exception as e:
             raise ConversionError(f"Erreur lors de l'import XML : {e}") from e
 
-    def import_from_string(self, data: str) -> Genealogy:
+    def import_from_stream(self, stream: BinaryIO) -> Genealogy:
+        """
+        Importe une généalogie depuis un flux binaire (fichier ``rb``, ``BytesIO``).
+
+        L'encodage est celui de la déclaration XML du document.
+
+        Args:
+            stream: Flux binaire contenant le document XML
+
+        Returns:
+            Objet Genealogy importé
+
+        Raises:
+            ConversionError: En cas d'erreur de conversion
+        """
+        try:
+            content = stream.read()
+        except Exception as e:
+            raise ConversionError(f"Erreur lors de l'import XML : {e}") from e
+
+        return self.import_from_string(content)
+
+    def import_from_string(self, data: Union[str, bytes]) -> Genealogy:
         """
         Importe une généalogie depuis une chaîne XML.
 
         Args:
-            data: Chaîne XML à importer
+            data: Chaîne XML à importer (ou octets, encodage selon la déclaration)
 
         Returns:
             Objet Genealogy importé
@@ -392,8 +477,12 @@ class XMLImporter(BaseImporter):
             ConversionError: En cas d'erreur de conversion
         """
         try:
+            # Rejet immédiat d'un texte qui ne peut pas être un document XML
+            if isinstance(data, str) and not _XML_START.match(data):
+                raise ValueError("le document ne commence pas par '<'")
+
             # Parser le XML
-            root = ET.fromstring(data)
+            root = _xml_fromstring(data)
 
             self._xml_attrib_id_to_unique_id.clear()
 
@@ -416,8 +505,6 @@ class XMLImporter(BaseImporter):
                     if family:
                         genealogy.add_family(family)
 
-            genealogy._update_cross_references()
-
             return genealogy
 
         except Exception as e:
@@ -451,8 +538,8 @@ class XMLImporter(BaseImporter):
                     gender = Gender.UNKNOWN
 
             person = Person(
-                last_name=elem.get("last_name", ""),
-                first_name=elem.get("first_name", ""),
+                last_name=self._intern(elem.get("last_name", "")),
+                first_name=self._intern(elem.get("first_name", "")),
                 public_name=elem.get("public_name"),
                 gender=gender,
             )
@@ -481,15 +568,15 @@ class XMLImporter(BaseImporter):
             # Lieux
             birth_place_elem = elem.find("birth_place")
             if birth_place_elem is not None and birth_place_elem.text:
-                person.birth_place = birth_place_elem.text.strip()
+                person.birth_place = self._intern(birth_place_elem.text.strip())
 
             death_place_elem = elem.find("death_place")
             if death_place_elem is not None and death_place_elem.text:
-                person.death_place = death_place_elem.text.strip()
+                person.death_place = self._intern(death_place_elem.text.strip())
 
             baptism_place_elem = elem.find("baptism_place")
             if baptism_place_elem is not None and baptism_place_elem.text:
-                person.baptism_place = baptism_place_elem.text.strip()
+                person.baptism_place = self._intern(baptism_place_elem.text.strip())
 
             # Titres
             titles_elem = elem.find("titles")
@@ -571,24 +658,29 @@ class XMLImporter(BaseImporter):
             # Lieux
             marriage_place_elem = elem.find("marriage_place")
             if marriage_place_elem is not None and marriage_place_elem.text:
-                family.marriage_place = marriage_place_elem.text.strip()
+                family.marriage_place = self._intern(marriage_place_elem.text.strip())
 
             # Enfants
             children_elem = elem.find("children")
             if children_elem is not None:
-                for child_elem in children_elem.findall("child"):
-                    raw_pid = child_elem.get("person_id")
-                    resolved = self._resolve_person_ref(raw_pid)
-                    if resolved:
-                        family.add_child(resolved)
+                resolved_ids = (
+                    self._resolve_person_ref(child_elem.get("person_id"))
+                    for child_elem in children_elem.findall("child")
+                )
+                family.extend_children(
+                    (resolved, ChildSex.UNKNOWN)
+                    for resolved in resolved_ids
+                    if resolved
+                )
 
             # Événements familiaux
             events_elem = elem.find("events")
             if events_elem is not None:
-                for event_elem in events_elem.findall("event"):
-                    fevt = self._deserialize_family_event(event_elem)
-                    if fevt is not None:
-                        family.add_event(fevt)
+                fevts = (
+                    self._deserialize_family_event(event_elem)
+                    for event_elem in events_elem.findall("event")
+                )
+                family.extend_events(fevt for fevt in fevts if fevt is not None)
 
             # Sources et témoins
             family_source_elem = elem.find("family_source")
@@ -631,19 +723,14 @@ class XMLImporter(BaseImporter):
         """Désérialise un événement personnel depuis un élément XML."""
 
         event_type_str = (elem.get("type") or "").strip()
-        try:
-            event_type = (
-                EventType(event_type_str) if event_type_str else EventType.OTHER
-            )
-        except ValueError:
-            event_type = EventType.OTHER
+        event_type = _EVENT_TYPE_BY_CODE.get(event_type_str, EventType.OTHER)
 
         date_elem = elem.find("date")
         date = self._deserialize_date(date_elem) if date_elem is not None else None
 
         place_elem = elem.find("place")
         place = (
-            place_elem.text.strip()
+            self._intern(place_elem.text.strip())
             if place_elem is not None and place_elem.text
             else None
         )
@@ -680,12 +767,7 @@ class XMLImporter(BaseImporter):
         """Désérialise un événement familial depuis un élément XML."""
 
         event_type_str = (elem.get("type") or "").strip()
-        try:
-            event_type = (
-                EventType(event_type_str) if event_type_str else EventType.OTHER
-            )
-        except ValueError:
-            event_type = EventType.OTHER
+        event_type = _EVENT_TYPE_BY_CODE.get(event_type_str, EventType.OTHER)
 
         fet = self._event_type_to_family_event_type(event_type)
 
@@ -694,7 +776,7 @@ class XMLImporter(BaseImporter):
 
         place_elem = elem.find("place")
         place = (
-            place_elem.text.strip()
+            self._intern(place_elem.text.strip())
             if place_elem is not None and place_elem.text
             else None
         )
@@ -732,15 +814,7 @@ class XMLImporter(BaseImporter):
         self, event_type: EventType
     ) -> FamilyEventType:
         """Associe un ``EventType`` générique à un ``FamilyEventType``."""
-
-        mapping = {
-            EventType.MARRIAGE: FamilyEventType.MARRIAGE,
-            EventType.DIVORCE: FamilyEventType.DIVORCE,
-            EventType.SEPARATION: FamilyEventType.SEPARATION,
-            EventType.ENGAGEMENT: FamilyEventType.ENGAGEMENT,
-            EventType.PACS: FamilyEventType.PACS,
-        }
-        return mapping.get(event_type, FamilyEventType.NO_MENTION)
+        return _FAMILY_EVENT_TYPES.get(event_type, FamilyEventType.NO_MENTION)
 
     def _deserialize_date(self, elem: ET.Element) -> Optional[Date]:
         """Désérialise une date depuis un élément XML."""
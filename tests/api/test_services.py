@@ -37,6 +37,17 @@ def service():
     return GenealogyService()
 
 
+@pytest.fixture
+def person_data():
+    """Données de création d'une personne (Jean Dupont)."""
+    return PersonCreateSchema(
+        first_name="Jean",
+        surname="Dupont",
+        sex="male",
+        access_level="public",
+    )
+
+
 @pytest.fixture
 def sample_person():
     """Personne d'exemple."""
@@ -117,87 +128,66 @@ class TestGenealogyServiceLoad:
 class TestPersonOperations:
     """Tests pour les opérations sur les personnes."""
 
-    def test_create_person(self, service):
+    def test_create_person(self, service, person_data):
         """Test création d'une personne."""
-        person_data = PersonCreateSchema(
-            first_name="Jean",
-            surname="Dupont",
-            sex="male",
-            access_level="public",
-        )
         person = service.create_person(person_data)
         assert person is not None
         assert person.first_name == "Jean"
         assert person.last_name == "Dupont"
 
-    def test_get_person_existing(self, service):
-        """Test récupération d'une personne existante."""
-        # Créer une personne d'abord
-        person_data = PersonCreateSchema(
-            first_name="Jean",
-            surname="Dupont",
-            sex="male",
-            access_level="public",
+    @pytest.mark.parametrize(
+        "existing, expected_first_name",
+        [
+            pytest.param(True, "Jean", id="existing"),
+            pytest.param(False, None, id="not_found"),
+        ],
+    )
+    def test_get_person(self, service, person_data, existing, expected_first_name):
+        """Test récupération d'une personne existante ou inexistante."""
+        person_id = (
+            service.create_person(person_data).unique_id
+            if existing
+            else "non_existent_id"
         )
-        created_person = service.create_person(person_data)
 
-        # Récupérer la personne
-        person = service.get_person(created_person.unique_id)
-        assert person is not None
-        assert person.first_name == "Jean"
+        person = service.get_person(person_id)
 
-    def test_get_person_not_found(self, service):
-        """Test récupération d'une personne inexistante."""
-        person = service.get_person("non_existent_id")
-        assert person is None
+        assert (person.first_name if person else None) == expected_first_name
 
-    def test_update_person(self, service):
-        """Test mise à jour d'une personne."""
-        # Créer une personne
-        person_data = PersonCreateSchema(
-            first_name="Jean",
-            surname="Dupont",
-            sex="male",
-            access_level="public",
+    @pytest.mark.parametrize(
+        "existing, expected_first_name",
+        [
+            pytest.param(True, "Jean-Pierre", id="existing"),
+            pytest.param(False, None, id="not_found"),
+        ],
+    )
+    def test_update_person(self, service, person_data, existing, expected_first_name):
+        """Test mise à jour d'une personne existante ou inexistante."""
+        person_id = (
+            service.create_person(person_data).unique_id if existing else "non_existent"
         )
-        created_person = service.create_person(person_data)
 
-        # Mettre à jour
         update_data = PersonUpdateSchema(first_name="Jean-Pierre")
-        updated_person = service.update_person(created_person.unique_id, update_data)
-
-        assert updated_person is not None
-        assert updated_person.first_name == "Jean-Pierre"
+        updated_person = service.update_person(person_id, update_data)
 
-    def test_update_person_not_found(self, service):
-        """Test mise à jour d'une personne inexistante."""
-        update_data = PersonUpdateSchema(first_name="Jean")
-        updated_person = service.update_person("non_existent", update_data)
-        assert updated_person is None
+        assert (
+            updated_person.first_name if updated_person else None
+        ) == expected_first_name
 
-    def test_delete_person(self, service):
-        """Test suppression d'une personne."""
-        # Créer une personne
-        person_data = PersonCreateSchema(
-            first_name="Jean",
-            surname="Dupont",
-            sex="male",
-            access_level="public",
+    @pytest.mark.parametrize(
+        "existing",
+        [pytest.param(True, id="existing"), pytest.param(False, id="not_found")],
+    )
+    def test_delete_person(self, service, person_data, existing):
+        """Test suppression d'une personne existante ou inexistante."""
+        person_id = (
+            service.create_person(person_data).unique_id if existing else "non_existent"
         )
-        created_person = service.create_person(person_data)
 
-        # Supprimer
-        result = service.delete_person(created_person.unique_id)
-        assert result is True
+        assert service.delete_person(person_id) is existing
 
-        # Vérifier que la personne n'existe plus
-        person = service.get_person(created_person.unique_id)
-        assert person is None
-
-    def test_delete_person_not_found(self, service):
-        """Test suppression d'une personne inexistante."""
-        result = service.delete_person("non_existent")
-        assert result is False
+        # Dans les deux cas, la personne n'existe plus
+        assert service.get_person(person_id) is None
 
     def test_search_persons_empty(self, service):
         """Test recherche de personnes sans résultats."""
@@ -5,6 +5,8 @@ Ce fichier contient les fixtures et configurations partagées
 pour tous les tests.
 """
 
+from types import SimpleNamespace
+
 import pytest
 
 try:
@@ -13,8 +15,15 @@ except ImportError:
     # Optional deps (ex. job « packaging » : wheel seul sans extra [api])
     limiter = None
 
+from geneweb_py.core.exceptions import (
+    GeneWebConversionError,
+    GeneWebParseError,
+    GeneWebValidationError,
+)
 from geneweb_py.core.models import (
     Date,
+    Event,
+    EventType,
     Family,
     Gender,
     Genealogy,
@@ -28,6 +37,20 @@ def pytest_configure(config):
         limiter.enabled = False
 
 
+@pytest.fixture(scope="session")
+def err_pool() -> SimpleNamespace:
+    """Réserve d'erreurs pré-construites partagée par toute la session
+
+    Les erreurs ne sont jamais levées ni modifiées par les tests qui les
+    consomment : une seule instance par configuration suffit.
+    """
+    return SimpleNamespace(
+        parse=[GeneWebParseError(f"E{i}", line_number=i) for i in range(5)],
+        validation=[GeneWebValidationError(f"V{i}") for i in range(5)],
+        conversion=[GeneWebConversionError(f"C{i}") for i in range(5)],
+    )
+
+
 @pytest.fixture
 def sample_date() -> Date:
     """Fixture pour une date d'exemple"""
@@ -97,6 +120,33 @@ def sample_genealogy(sample_person, sample_person_2, sample_family) -> Genealogy
     return genealogy
 
 
+@pytest.fixture(scope="module")
+def jean_genealogy() -> Genealogy:
+    """DUPONT Jean avec naissance et diplôme, partagé en lecture seule
+
+    Construit une fois par module : les tests d'export et d'aller-retour
+    ne la modifient pas.
+    """
+    genealogy = Genealogy()
+    person = Person(
+        last_name="DUPONT",
+        first_name="Jean",
+        gender=Gender.MALE,
+        birth_date=Date(year=1950, month=3, day=15),
+        birth_place="Paris, France",
+    )
+    person.add_event(
+        Event(
+            event_type=EventType.GRADUATION,
+            date=Date(year=1972, month=6),
+            place="Université de Paris",
+            notes=["Diplôme d'ingénieur"],
+        )
+    )
+    genealogy.add_person(person)
+    return genealogy
+
+
 @pytest.fixture
 def sample_gw_content() -> str:
     """Fixture pour du contenu .gw d'exemple"""
@@ -4,6 +4,7 @@ Tests pour les classes de base des convertisseurs
 
 import pytest
 
+from geneweb_py.core.exceptions import GeneWebConversionError
 from geneweb_py.core.genealogy import Genealogy
 from geneweb_py.core.person import Gender, Person
 from geneweb_py.formats.base import BaseExporter, BaseImporter, ConversionError
@@ -12,17 +13,15 @@ from geneweb_py.formats.base import BaseExporter, BaseImporter, ConversionError
 class TestConversionError:
     """Tests pour ConversionError."""
 
-    def test_conversion_error_creation(self):
-        """Test création d'une ConversionError."""
-        error = ConversionError("Test error")
-        assert str(error) == "Test error"
-        assert isinstance(error, Exception)
+    def test_is_subclass(self):
+        """ConversionError spécialise GeneWebConversionError (comportement hérité)."""
+        assert issubclass(ConversionError, GeneWebConversionError)
 
     def test_conversion_error_with_details(self):
         """Test ConversionError avec détails."""
         error = ConversionError("Test error", details={"line": 10, "column": 5})
         assert str(error) == "Test error"
-        assert hasattr(error, "details")
+        assert error.details == {"line": 10, "column": 5}
 
 
 class TestBaseExporter:
@@ -13,6 +13,8 @@ pytest.importorskip("rich")
 
 from geneweb_py.cli import commands as cli_commands
 from geneweb_py.cli.commands import cli
+from geneweb_py.core.exceptions import GeneWebEncodingError
+from geneweb_py.core.genealogy import Genealogy
 
 FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
 SIMPLE_GW = FIXTURES_DIR / "simple_test.gw"
@@ -153,7 +155,6 @@ def test_parse_summary_includes_validation_errors_row(
 ) -> None:
     """Une ligne « Avertissements / erreurs » si ``validation_errors`` non vide."""
     from geneweb_py.core.exceptions import ErrorSeverity, GeneWebError
-    from geneweb_py.core.genealogy import Genealogy
 
     genealogy = Genealogy()
     genealogy.validation_errors.append(
@@ -173,8 +174,6 @@ def test_parse_command_encoding_error(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
-    from geneweb_py.core.exceptions import GeneWebEncodingError
-
     monkeypatch.setattr(
         cli_commands,
         "_parse_genealogy",
@@ -231,8 +230,6 @@ def test_export_command_encoding_error(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
-    from geneweb_py.core.exceptions import GeneWebEncodingError
-
     monkeypatch.setattr(
         cli_commands,
         "_parse_genealogy",
@@ -272,7 +269,6 @@ def test_export_command_conversion_error(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
-    from geneweb_py.core.genealogy import Genealogy
     from geneweb_py.formats.base import ConversionError
 
     monkeypatch.setattr(cli_commands, "_parse_genealogy", lambda _p: Genealogy())
@@ -301,8 +297,6 @@ def test_export_command_os_error(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
-    from geneweb_py.core.genealogy import Genealogy
-
     monkeypatch.setattr(cli_commands, "_parse_genealogy", lambda _p: Genealogy())
 
     class OsFailExporter:
@@ -330,8 +324,6 @@ def test_export_command_unexpected_export_exception(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
-    from geneweb_py.core.genealogy import Genealogy
-
     monkeypatch.setattr(cli_commands, "_parse_genealogy", lambda _p: Genealogy())
 
     class BoomExporter:
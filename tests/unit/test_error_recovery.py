@@ -22,13 +22,13 @@ from geneweb_py.core.parser.gw_parser import GeneWebParser
 class TestErrorCollector:
     """Tests pour le collecteur d'erreurs"""
 
-    def test_error_collector_basic(self):
+    def test_error_collector_basic(self, err_pool):
         """Test basique du collecteur d'erreurs"""
         collector = GeneWebErrorCollector(strict=False)
 
         # Ajouter quelques erreurs
-        collector.add_error(GeneWebParseError("Erreur 1", line_number=1))
-        collector.add_error(GeneWebParseError("Erreur 2", line_number=2))
+        for error in err_pool.parse[:2]:
+            collector.add_error(error)
         collector.add_warning("Avertissement 1", line_number=3)
 
         assert collector.has_errors()
@@ -49,12 +49,12 @@ class TestErrorCollector:
         with pytest.raises(GeneWebParseError):
             collector.add_error(GeneWebParseError("Erreur critique", line_number=2))
 
-    def test_error_collector_filtering(self):
+    def test_error_collector_filtering(self, err_pool):
         """Test du filtrage des erreurs par type et sévérité"""
         collector = GeneWebErrorCollector(strict=False)
 
-        collector.add_error(GeneWebParseError("Parse erreur", line_number=1))
-        collector.add_error(GeneWebValidationError("Validation erreur", line_number=2))
+        collector.add_error(err_pool.parse[0])
+        collector.add_error(err_pool.validation[0])
         collector.add_warning("Warning", line_number=3)
 
         # Filtrer par type
@@ -68,7 +68,7 @@ class TestErrorCollector:
         warnings = collector.get_warnings()
         assert len(warnings) == 1
 
-    def test_error_collector_summary(self):
+    def test_error_collector_summary(self, err_pool):
         """Test du résumé des erreurs"""
         collector = GeneWebErrorCollector(strict=False)
 
@@ -76,20 +76,20 @@ class TestErrorCollector:
         assert "Aucune erreur" in collector.get_error_summary()
 
         # Avec erreurs
-        collector.add_error(GeneWebParseError("Erreur 1", line_number=1))
-        collector.add_error(GeneWebParseError("Erreur 2", line_number=2))
+        for error in err_pool.parse[:2]:
+            collector.add_error(error)
         collector.add_warning("Warning", line_number=3)
 
         summary = collector.get_error_summary()
         assert "avertissement" in summary.lower()
         assert "erreur" in summary.lower()
 
-    def test_error_collector_detailed_report(self):
+    def test_error_collector_detailed_report(self, err_pool):
         """Test du rapport détaillé"""
         collector = GeneWebErrorCollector(strict=False)
 
-        collector.add_error(GeneWebParseError("Erreur parse", line_number=1))
-        collector.add_error(GeneWebValidationError("Erreur validation", line_number=2))
+        collector.add_error(err_pool.parse[0])
+        collector.add_error(err_pool.validation[0])
         collector.add_warning("Warning", line_number=3)
 
         report = collector.get_detailed_report()
@@ -225,13 +225,13 @@ class TestErrorRecovery:
 
         assert len(genealogy.persons) >= 1
 
-    def test_multiple_errors_collection(self):
+    def test_multiple_errors_collection(self, err_pool):
         """Test de la collecte de plusieurs erreurs"""
         parser = GeneWebParser(strict=False, validate=True)
 
         # Simple test: le collecteur doit pouvoir accumuler les erreurs
-        parser.error_collector.add_error(GeneWebParseError("Erreur 1", line_number=1))
-        parser.error_collector.add_error(GeneWebParseError("Erreur 2", line_number=2))
+        for error in err_pool.parse[:2]:
+            parser.error_collector.add_error(error)
 
         assert parser.error_collector.error_count() == 2
 
@@ -5,6 +5,10 @@ Ces tests vérifient que toutes les exceptions personnalisées
 fonctionnent correctement avec leurs messages d'erreur.
 """
 
+import re
+
+import pytest
+
 from geneweb_py.core.exceptions import (
     GeneWebConversionError,
     GeneWebEncodingError,
@@ -14,182 +18,289 @@ from geneweb_py.core.exceptions import (
     GeneWebValidationError,
     ValidationResult,
 )
+from geneweb_py.formats.base import ConversionError
+
+# Résumés produits par GeneWebErrorCollector : « N erreur(s) » en tête de chaîne
+_SUMMARY_RE = re.compile(r"(\d+) erreur\(s\)")
+_COLLECTOR_STR_RE = re.compile(r"GeneWebErrorCollector\((\d+) erreur\(s\)\)")
+
+
+# Tables de paramétrage construites une seule fois à l'import du module
+_LINE_NUMBER_CASES = [
+    (None, "Message simple", "Message simple"),
+    (5, "Erreur ligne 5", "Ligne 5: Erreur ligne 5"),
+    (0, "Message ligne zéro", "Ligne 0: Message ligne zéro"),
+    (-1, "Message ligne négative", "Ligne -1: Message ligne négative"),
+    (999999, "Message grande ligne", "Ligne 999999: Message grande ligne"),
+]
+
+_PARSE_CASES = [
+    pytest.param(
+        {
+            "line_number": 20,
+            "token": "UNKNOWN_TOKEN",
+            "context": "fam CORNO Joseph",
+        },
+        {"token": "UNKNOWN_TOKEN", "context": "fam CORNO Joseph"},
+        ["Ligne 20", "Token trouvé: 'UNKNOWN_TOKEN'", "fam CORNO Joseph"],
+        id="with_token",
+    ),
+    pytest.param(
+        {
+            "line_number": 25,
+            "expected_token": "IDENTIFIER",
+            "actual_token": "EOF",
+        },
+        {"expected_token": "IDENTIFIER", "actual_token": "EOF"},
+        ["Ligne 25"],
+        id="expected_token",
+    ),
+]
+
+_VALIDATION_CASES = [
+    pytest.param(
+        {"field": "birth_date", "value": "invalid_date"},
+        {"field": "birth_date", "value": "invalid_date"},
+        ["Champ: birth_date", "Valeur: invalid_date"],
+        id="with_field",
+    ),
+    pytest.param(
+        {"entity_type": "Person", "entity_id": "CORNO_Joseph_0"},
+        {"entity_type": "Person", "entity_id": "CORNO_Joseph_0"},
+        ["Entité: Person 'CORNO_Joseph_0'"],
+        id="with_entity",
+    ),
+]
+
+_CONVERSION_CASES = [
+    pytest.param(
+        {"source_format": "GeneWeb", "target_format": "GEDCOM"},
+        {"source_format": "GeneWeb", "target_format": "GEDCOM"},
+        ["Format source: GeneWeb", "Format cible: GEDCOM"],
+        id="with_format",
+    ),
+    pytest.param(
+        {"data_type": "Family", "data_value": "fam INVALID"},
+        {"data_type": "Family", "data_value": "fam INVALID"},
+        [],
+        id="with_data",
+    ),
+]
+
+_ENCODING_CASES = [
+    pytest.param(
+        {"encoding": "utf-16", "detected_encoding": "iso-8859-1"},
+        {"encoding": "utf-16", "detected_encoding": "iso-8859-1"},
+        ["Encodage détecté: iso-8859-1"],
+        id="with_encoding",
+    ),
+    pytest.param(
+        {"byte_position": 1024, "invalid_byte": b"\xff"},
+        {"byte_position": 1024, "invalid_byte": b"\xff"},
+        ["Position: byte 1024", "Byte invalide: b'\\xff'"],
+        id="with_byte_position",
+    ),
+]
+
+_COMMON_CASES = [
+    (GeneWebError, {}),
+    (GeneWebParseError, {"token": "t", "expected": "e"}),
+    (GeneWebValidationError, {"field": "f", "value": "v"}),
+    (GeneWebEncodingError, {"encoding": "utf-8"}),
+    (GeneWebConversionError, {"source_format": "gw", "target_format": "gedcom"}),
+    (ConversionError, {"details": {"line": 1}}),
+]
+
+
+def _check_error(error, attrs, substrings):
+    """Vérifie en une passe les attributs et le message formaté d'une erreur"""
+    for name, value in attrs.items():
+        assert getattr(error, name) == value
+    error_str = str(error)
+    for substring in substrings:
+        assert substring in error_str
+
+
+# Les exceptions ci-dessous ne sont ni levées ni modifiées par les tests :
+# une instance par module suffit pour toutes les assertions en lecture seule.
+@pytest.fixture(scope="module")
+def line_context_error():
+    """Erreur de base avec ligne et contexte"""
+    return GeneWebError(
+        "Erreur de parsing",
+        line_number=10,
+        context="fam CORNO Joseph + THOMAS Marie",
+    )
+
+
+@pytest.fixture(scope="module")
+def parse_error():
+    """Erreur de parsing avec numéro de ligne"""
+    return GeneWebParseError("Erreur de parsing", line_number=15)
 
 
 class TestGeneWebError:
     """Tests pour l'exception de base GeneWebError"""
 
-    def test_basic_error(self):
-        """Test création d'une erreur de base"""
-        error = GeneWebError("Erreur de test")
-
-        assert str(error) == "Erreur de test"
-        assert error.message == "Erreur de test"
-        assert error.line_number is None
-        assert error.context is None
-
-    def test_error_with_line_number(self):
-        """Test erreur avec numéro de ligne"""
-        error = GeneWebError("Erreur ligne 5", line_number=5)
-
-        assert str(error) == "Ligne 5: Erreur ligne 5"
-        assert error.line_number == 5
+    @pytest.mark.parametrize(
+        "line_number,message,expected",
+        _LINE_NUMBER_CASES,
+        ids=["no_line", "with_line", "zero_line", "negative_line", "large_line"],
+    )
+    def test_line_number_formatting(self, line_number, message, expected):
+        """Test préfixe « Ligne N: » selon le numéro de ligne"""
+        error = GeneWebError(message, line_number=line_number)
+
+        assert str(error) == expected
+        assert error.line_number == line_number
+
+    @pytest.mark.parametrize(
+        "message",
+        ["Caractères spéciaux éàçù", "Message\nsur deux lignes", "Message\tavec tab"],
+        ids=["special_characters", "newlines", "tabs"],
+    )
+    def test_message_passthrough(self, message):
+        """Test message restitué tel quel (accents, sauts de ligne, tabulations)"""
+        error = GeneWebError(message)
+
+        assert str(error) == message
+        assert error.message == message
 
     def test_error_with_context(self):
         """Test erreur avec contexte"""
         error = GeneWebError("Erreur de parsing", context="fam CORNO Joseph")
 
-        assert "Erreur de parsing" in str(error)
-        assert "fam CORNO Joseph" in str(error)
-        assert error.context == "fam CORNO Joseph"
+        _check_error(
+            error,
+            {"context": "fam CORNO Joseph"},
+            ("Erreur de parsing", "fam CORNO Joseph"),
+        )
 
-    def test_error_with_line_and_context(self):
+    def test_error_with_line_and_context(self, line_context_error):
         """Test erreur avec ligne et contexte"""
-        error = GeneWebError(
-            "Erreur de parsing",
-            line_number=10,
-            context="fam CORNO Joseph + THOMAS Marie",
+        _check_error(
+            line_context_error,
+            {"line_number": 10, "context": "fam CORNO Joseph + THOMAS Marie"},
+            ("Ligne 10", "Erreur de parsing", "fam CORNO Joseph + THOMAS Marie"),
         )
 
-        assert "Ligne 10" in str(error)
-        assert "Erreur de parsing" in str(error)
-        assert "fam CORNO Joseph + THOMAS Marie" in str(error)
-        assert error.line_number == 10
-        assert error.context == "fam CORNO Joseph + THOMAS Marie"
-
-    def test_error_inheritance(self):
-        """Test héritage de l'exception"""
-        error = GeneWebError("Test héritage")
-
-        assert isinstance(error, Exception)
-        assert isinstance(error, GeneWebError)
-
 
 class TestGeneWebParseError:
     """Tests pour l'exception de parsing"""
 
-    def test_parse_error_basic(self):
+    def test_parse_error_basic(self, parse_error):
         """Test erreur de parsing basique"""
-        error = GeneWebParseError("Erreur de parsing", line_number=15)
+        error = parse_error
 
-        assert isinstance(error, GeneWebError)
-        assert isinstance(error, GeneWebParseError)
         assert str(error) == "Ligne 15: Erreur de parsing"
         assert error.line_number == 15
 
-    def test_parse_error_with_token(self):
-        """Test erreur de parsing avec token"""
-        error = GeneWebParseError(
-            "Token inattendu",
-            line_number=20,
-            token="UNKNOWN_TOKEN",
-            context="fam CORNO Joseph",
-        )
-
-        assert error.token == "UNKNOWN_TOKEN"
-        assert error.context == "fam CORNO Joseph"
-
-    def test_parse_error_expected_token(self):
-        """Test erreur avec token attendu"""
-        error = GeneWebParseError(
-            "Token attendu manquant",
-            line_number=25,
-            expected_token="IDENTIFIER",
-            actual_token="EOF",
-        )
+    @pytest.mark.parametrize(
+        "kwargs,expected_attrs,expected_substrings",
+        _PARSE_CASES,
+    )
+    def test_attributes(self, kwargs, expected_attrs, expected_substrings):
+        """Test attributs et message d'une erreur de parsing enrichie"""
+        error = GeneWebParseError("Erreur de parsing", **kwargs)
 
-        assert error.expected_token == "IDENTIFIER"
-        assert error.actual_token == "EOF"
+        _check_error(error, expected_attrs, expected_substrings)
 
 
 class TestGeneWebValidationError:
     """Tests pour l'exception de validation"""
 
-    def test_validation_error_basic(self):
-        """Test erreur de validation basique"""
-        error = GeneWebValidationError("Données invalides")
+    @pytest.mark.parametrize(
+        "kwargs,expected_attrs,expected_substrings",
+        _VALIDATION_CASES,
+    )
+    def test_attributes(self, kwargs, expected_attrs, expected_substrings):
+        """Test attributs et message d'une erreur de validation enrichie"""
+        error = GeneWebValidationError("Valeur invalide", **kwargs)
 
-        assert isinstance(error, GeneWebError)
-        assert isinstance(error, GeneWebValidationError)
-        assert str(error) == "Données invalides"
+        _check_error(error, expected_attrs, expected_substrings)
 
-    def test_validation_error_with_field(self):
-        """Test erreur de validation avec champ"""
-        error = GeneWebValidationError(
-            "Valeur invalide", field="birth_date", value="invalid_date"
-        )
 
-        assert error.field == "birth_date"
-        assert error.value == "invalid_date"
+class TestGeneWebConversionError:
+    """Tests pour l'exception de conversion"""
 
-    def test_validation_error_with_entity(self):
-        """Test erreur de validation avec entité"""
-        error = GeneWebValidationError(
-            "Personne invalide", entity_type="Person", entity_id="CORNO_Joseph_0"
-        )
+    @pytest.mark.parametrize(
+        "kwargs,expected_attrs,expected_substrings",
+        _CONVERSION_CASES,
+    )
+    def test_attributes(self, kwargs, expected_attrs, expected_substrings):
+        """Test attributs et message d'une erreur de conversion enrichie"""
+        error = GeneWebConversionError("Format non supporté", **kwargs)
 
-        assert error.entity_type == "Person"
-        assert error.entity_id == "CORNO_Joseph_0"
+        _check_error(error, expected_attrs, expected_substrings)
 
 
-class TestGeneWebConversionError:
-    """Tests pour l'exception de conversion"""
+class TestGeneWebEncodingError:
+    """Tests pour l'exception d'encodage"""
 
-    def test_conversion_error_basic(self):
-        """Test erreur de conversion basique"""
-        error = GeneWebConversionError("Erreur de conversion")
+    @pytest.mark.parametrize(
+        "kwargs,expected_attrs,expected_substrings",
+        _ENCODING_CASES,
+    )
+    def test_attributes(self, kwargs, expected_attrs, expected_substrings):
+        """Test attributs et message d'une erreur d'encodage enrichie"""
+        error = GeneWebEncodingError("Encodage non supporté", **kwargs)
 
-        assert isinstance(error, GeneWebError)
-        assert isinstance(error, GeneWebConversionError)
-        assert str(error) == "Erreur de conversion"
+        _check_error(error, expected_attrs, expected_substrings)
 
-    def test_conversion_error_with_format(self):
-        """Test erreur de conversion avec format"""
-        error = GeneWebConversionError(
-            "Format non supporté", source_format="GeneWeb", target_format="GEDCOM"
-        )
 
-        assert error.source_format == "GeneWeb"
-        assert error.target_format == "GEDCOM"
+@pytest.mark.parametrize(
+    "error_cls,extra_attrs",
+    _COMMON_CASES,
+    ids=["base", "parse", "validation", "encoding", "conversion", "alias"],
+)
+class TestExceptionCommon:
+    """Tests communs à toutes les exceptions, paramétrés par classe"""
 
-    def test_conversion_error_with_data(self):
-        """Test erreur de conversion avec données"""
-        error = GeneWebConversionError(
-            "Données corrompues", data_type="Family", data_value="fam INVALID"
-        )
+    def test_basic(self, error_cls, extra_attrs):
+        """Test création avec le seul message"""
+        error = error_cls("Erreur de test")
 
-        assert error.data_type == "Family"
-        assert error.data_value == "fam INVALID"
+        assert str(error) == "Erreur de test"
+        assert error.message == "Erreur de test"
+        assert error.line_number is None
+        assert error.context is None
 
+    def test_line_number(self, error_cls, extra_attrs):
+        """Test préfixe de ligne quelle que soit la classe"""
+        error = error_cls("Erreur de test", line_number=7)
 
-class TestGeneWebEncodingError:
-    """Tests pour l'exception d'encodage"""
+        assert error.line_number == 7
+        assert str(error).startswith("Ligne 7: Erreur de test")
 
-    def test_encoding_error_basic(self):
-        """Test erreur d'encodage basique"""
-        error = GeneWebEncodingError("Erreur d'encodage")
+    def test_kwargs(self, error_cls, extra_attrs):
+        """Test attributs spécifiques et kwargs libres exposés en attributs"""
+        error = error_cls("Erreur de test", custom_attr="valeur", **extra_attrs)
 
-        assert isinstance(error, GeneWebError)
-        assert isinstance(error, GeneWebEncodingError)
-        assert str(error) == "Erreur d'encodage"
+        assert error.custom_attr == "valeur"
+        for name, value in extra_attrs.items():
+            assert getattr(error, name) == value
 
-    def test_encoding_error_with_encoding(self):
-        """Test erreur d'encodage avec détails"""
-        error = GeneWebEncodingError(
-            "Encodage non supporté", encoding="utf-16", detected_encoding="iso-8859-1"
-        )
 
-        assert error.encoding == "utf-16"
-        assert error.detected_encoding == "iso-8859-1"
+class TestExceptionInheritance:
+    """Tests pour la hiérarchie des exceptions"""
 
-    def test_encoding_error_with_byte_position(self):
-        """Test erreur d'encodage avec position"""
-        error = GeneWebEncodingError(
-            "Caractère invalide", byte_position=1024, invalid_byte=b"\xff"
-        )
+    @pytest.mark.parametrize(
+        "error_cls,bases",
+        [
+            (GeneWebError, (Exception,)),
+            (GeneWebParseError, (GeneWebError, Exception)),
+            (GeneWebValidationError, (GeneWebError, Exception)),
+            (GeneWebEncodingError, (GeneWebError, Exception)),
+            (GeneWebConversionError, (GeneWebError, Exception)),
+        ],
+        ids=["base", "parse", "validation", "encoding", "conversion"],
+    )
+    def test_inheritance(self, error_cls, bases):
+        """Test héritage de chaque exception"""
+        error = error_cls("Test héritage")
 
-        assert error.byte_position == 1024
-        assert error.invalid_byte == b"\xff"
+        for base in bases:
+            assert isinstance(error, base)
 
 
 class TestGeneWebErrorCollector:
@@ -203,10 +314,10 @@ class TestGeneWebErrorCollector:
         assert not collector.has_errors()
         assert len(collector.get_errors()) == 0
 
-    def test_add_single_error(self):
+    def test_add_single_error(self, err_pool):
         """Test ajout d'une erreur"""
         collector = GeneWebErrorCollector()
-        error = GeneWebParseError("Erreur de test", line_number=10)
+        error = err_pool.parse[0]
 
         collector.add_error(error)
 
@@ -214,13 +325,13 @@ class TestGeneWebErrorCollector:
         assert collector.has_errors()
         assert collector.errors[0] == error
 
-    def test_add_multiple_errors(self):
+    def test_add_multiple_errors(self, err_pool):
         """Test ajout de plusieurs erreurs"""
         collector = GeneWebErrorCollector()
 
-        error1 = GeneWebParseError("Erreur 1", line_number=10)
-        error2 = GeneWebValidationError("Erreur 2")
-        error3 = GeneWebConversionError("Erreur 3")
+        error1 = err_pool.parse[0]
+        error2 = err_pool.validation[0]
+        error3 = err_pool.conversion[0]
 
         collector.add_error(error1)
         collector.add_error(error2)
@@ -235,14 +346,13 @@ class TestGeneWebErrorCollector:
         assert errors[1] == error2
         assert errors[2] == error3
 
-    def test_get_errors_by_type(self):
+    def test_get_errors_by_type(self, err_pool):
         """Test récupération d'erreurs par type"""
         collector = GeneWebErrorCollector()
 
-        parse_error = GeneWebParseError("Erreur de parsing")
-        validation_error1 = GeneWebValidationError("Erreur de validation 1")
-        validation_error2 = GeneWebValidationError("Erreur de validation 2")
-        conversion_error = GeneWebConversionError("Erreur de conversion")
+        parse_error = err_pool.parse[0]
+        validation_error1, validation_error2 = err_pool.validation[:2]
+        conversion_error = err_pool.conversion[0]
 
         collector.add_error(parse_error)
         collector.add_error(validation_error1)
@@ -264,12 +374,12 @@ class TestGeneWebErrorCollector:
         assert len(parse_errors) == 1
         assert parse_errors[0] == parse_error
 
-    def test_clear_errors(self):
+    def test_clear_errors(self, err_pool):
         """Test suppression des erreurs"""
         collector = GeneWebErrorCollector()
 
-        error1 = GeneWebParseError("Erreur 1")
-        error2 = GeneWebValidationError("Erreur 2")
+        error1 = err_pool.parse[0]
+        error2 = err_pool.validation[0]
 
         collector.add_error(error1)
         collector.add_error(error2)
@@ -282,22 +392,22 @@ class TestGeneWebErrorCollector:
         assert len(collector.errors) == 0
         assert not collector.has_errors()
 
-    def test_error_count(self):
+    def test_error_count(self, err_pool):
         """Test comptage des erreurs"""
         collector = GeneWebErrorCollector()
 
         assert collector.error_count() == 0
 
-        collector.add_error(GeneWebParseError("Erreur 1"))
+        collector.add_error(err_pool.parse[0])
         assert collector.error_count() == 1
 
-        collector.add_error(GeneWebValidationError("Erreur 2"))
+        collector.add_error(err_pool.validation[0])
         assert collector.error_count() == 2
 
         collector.clear_errors()
         assert collector.error_count() == 0
 
-    def test_get_error_summary(self):
+    def test_get_error_summary(self, err_pool):
         """Test résumé des erreurs"""
         collector = GeneWebErrorCollector()
 
@@ -306,39 +416,42 @@ class TestGeneWebErrorCollector:
         assert summary == "Aucune erreur"
 
         # Une erreur
-        collector.add_error(GeneWebParseError("Erreur de parsing", line_number=10))
+        collector.add_error(err_pool.parse[0])
         summary = collector.get_error_summary()
-        assert "1 erreur" in summary
+        m = _SUMMARY_RE.match(summary)
+        assert m and int(m.group(1)) == 1
 
         # Plusieurs erreurs
-        collector.add_error(GeneWebValidationError("Erreur de validation"))
-        collector.add_error(GeneWebConversionError("Erreur de conversion"))
+        collector.add_error(err_pool.validation[0])
+        collector.add_error(err_pool.conversion[0])
 
         summary = collector.get_error_summary()
-        assert "3 erreur" in summary
+        m = _SUMMARY_RE.match(summary)
+        assert m and int(m.group(1)) == 3
 
-    def test_context_manager(self):
+    def test_context_manager(self, err_pool):
         """Test utilisation comme contexte manager"""
         collector = GeneWebErrorCollector()
 
         with collector:
-            collector.add_error(GeneWebParseError("Erreur dans le contexte"))
+            collector.add_error(err_pool.parse[0])
 
         assert len(collector.errors) == 1
         assert collector.has_errors()
 
-    def test_str_representation(self):
+    def test_str_representation(self, err_pool):
         """Test représentation string"""
         collector = GeneWebErrorCollector()
 
         # Sans erreurs
         str_repr = str(collector)
-        assert "Aucune erreur" in str_repr
+        assert str_repr == "GeneWebErrorCollector(Aucune erreur)"
 
         # Avec erreurs
-        collector.add_error(GeneWebParseError("Erreur de test", line_number=5))
+        collector.add_error(err_pool.parse[0])
         str_repr = str(collector)
-        assert "1 erreur" in str_repr
+        m = _COLLECTOR_STR_RE.match(str_repr)
+        assert m and int(m.group(1)) == 1
 
 
 class TestValidationResult:
@@ -352,12 +465,11 @@ class TestValidationResult:
         assert not result.has_errors()
         assert len(result.errors) == 0
 
-    def test_validation_result_with_errors(self):
+    def test_validation_result_with_errors(self, err_pool):
         """Test résultat de validation avec erreurs"""
         result = ValidationResult()
 
-        error1 = GeneWebValidationError("Erreur 1")
-        error2 = GeneWebValidationError("Erreur 2")
+        error1, error2 = err_pool.validation[:2]
 
         result.add_error(error1)
         result.add_error(error2)
@@ -366,29 +478,27 @@ class TestValidationResult:
         assert result.has_errors()
         assert len(result.errors) == 2
 
-    def test_validation_result_get_error_messages(self):
+    def test_validation_result_get_error_messages(self, err_pool):
         """Test récupération des messages d'erreur"""
         result = ValidationResult()
 
-        error1 = GeneWebValidationError("Première erreur")
-        error2 = GeneWebValidationError("Deuxième erreur")
+        error1, error2 = err_pool.validation[:2]
 
         result.add_error(error1)
         result.add_error(error2)
 
         messages = result.get_error_messages()
         assert len(messages) == 2
-        assert "Première erreur" in messages
-        assert "Deuxième erreur" in messages
+        assert set(messages) == {str(error1), str(error2)}
 
-    def test_validation_result_combined_error(self):
+    def test_validation_result_combined_error(self, err_pool):
         """Test combinaison avec GeneWebErrorCollector"""
         collector = GeneWebErrorCollector()
         result = ValidationResult()
 
         # Ajouter des erreurs au collecteur
-        collector.add_error(GeneWebParseError("Erreur de parsing"))
-        collector.add_error(GeneWebValidationError("Erreur de validation"))
+        collector.add_error(err_pool.parse[0])
+        collector.add_error(err_pool.validation[0])
 
         # Ajouter au résultat
         result.add_errors_from_collector(collector)
@@ -397,7 +507,7 @@ class TestValidationResult:
         assert result.has_errors()
         assert len(result.errors) == 2
 
-    def test_validation_result_str_representation(self):
+    def test_validation_result_str_representation(self, err_pool):
         """Test représentation string"""
         result = ValidationResult()
 
@@ -406,7 +516,7 @@ class TestValidationResult:
         assert "Validation réussie" in str_repr or "Valid" in str_repr
 
         # Résultat avec erreurs
-        result.add_error(GeneWebValidationError("Erreur de test"))
+        result.add_error(err_pool.validation[0])
         str_repr = str(result)
         assert "erreur" in str_repr.lower()
 
@@ -445,43 +555,48 @@ class TestExceptionChaining:
 class TestExceptionMessages:
     """Tests pour les messages d'erreur détaillés"""
 
-    def test_parse_error_detailed_message(self):
-        """Test message détaillé d'erreur de parsing"""
-        error = GeneWebParseError(
-            "Token inattendu",
-            line_number=15,
-            column=8,
-            context="fam CORNO Joseph + THOMAS",
-            expected_token="IDENTIFIER",
-            actual_token="PLUS",
-        )
+    @pytest.mark.parametrize(
+        "error_cls,message,kwargs",
+        [
+            pytest.param(
+                GeneWebParseError,
+                "Token inattendu",
+                {
+                    "line_number": 15,
+                    "column": 8,
+                    "context": "fam CORNO Joseph + THOMAS",
+                    "expected_token": "IDENTIFIER",
+                    "actual_token": "PLUS",
+                },
+                id="parse",
+            ),
+            pytest.param(
+                GeneWebValidationError,
+                "Date de naissance invalide",
+                {
+                    "field": "birth_date",
+                    "value": "32/13/2020",
+                    "entity_type": "Person",
+                    "entity_id": "CORNO_Joseph_0",
+                },
+                id="validation",
+            ),
+            pytest.param(
+                GeneWebConversionError,
+                "Impossible de convertir la famille",
+                {
+                    "source_format": "GeneWeb",
+                    "target_format": "GEDCOM",
+                    "data_type": "Family",
+                    "data_value": "fam INVALID_DATA",
+                },
+                id="conversion",
+            ),
+        ],
+    )
+    def test_detailed_message(self, error_cls, message, kwargs):
+        """Test message détaillé : le message principal figure toujours dans str()"""
+        error = error_cls(message, **kwargs)
 
-        message = str(error)
-        assert "Token inattendu" in message
         # Le message peut inclure des détails supplémentaires selon l'implémentation
-
-    def test_validation_error_detailed_message(self):
-        """Test message détaillé d'erreur de validation"""
-        error = GeneWebValidationError(
-            "Date de naissance invalide",
-            field="birth_date",
-            value="32/13/2020",
-            entity_type="Person",
-            entity_id="CORNO_Joseph_0",
-        )
-
-        message = str(error)
-        assert "Date de naissance invalide" in message
-
-    def test_conversion_error_detailed_message(self):
-        """Test message détaillé d'erreur de conversion"""
-        error = GeneWebConversionError(
-            "Impossible de convertir la famille",
-            source_format="GeneWeb",
-            target_format="GEDCOM",
-            data_type="Family",
-            data_value="fam INVALID_DATA",
-        )
-
-        message = str(error)
-        assert "Impossible de convertir la famille" in message
+        assert message in str(error)
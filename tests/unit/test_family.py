@@ -5,133 +5,184 @@ Ces tests vérifient la création et manipulation des familles
 dans le format GeneWeb.
 """
 
+import sys
+from typing import Any, Callable
+
+import pytest
+
 from geneweb_py.core.date import Date
-from geneweb_py.core.family import Child, ChildSex, Family, MarriageStatus
+from geneweb_py.core.event import EventType, FamilyEvent, FamilyEventType
+from geneweb_py.core.exceptions import GeneWebValidationError
+from geneweb_py.core.family import (
+    MARRIAGE_AFTER_DIVORCE,
+    NO_SPOUSE,
+    Child,
+    ChildSex,
+    Family,
+    MarriageStatus,
+)
+
+FAM_ID = "FAM001"
+HUSBAND_ID = "CORNO_Joseph_0"
+WIFE_ID = "THOMAS_Marie_0"
+# Dates parsées une seule fois, à l'import du module
+D_2015 = Date.parse("10/08/2015")
+D_2010 = Date.parse("10/08/2010")
+D_2020 = Date.parse("10/01/2020")
+# Membres d'énumération liés une fois (noms globaux dans les tests)
+MALE, FEMALE, UNKNOWN_SEX = ChildSex.MALE, ChildSex.FEMALE, ChildSex.UNKNOWN
+MARRIED, NOT_MARRIED = MarriageStatus.MARRIED, MarriageStatus.NOT_MARRIED
+
+
+@pytest.fixture(scope="module")
+def base_family_factory() -> Callable[..., Family]:
+    """Fabrique du couple canonique CORNO Joseph + THOMAS Marie
+
+    Chaque appel retourne une nouvelle instance : à utiliser dès que le test
+    modifie la famille (ajout d'enfant, de témoin...).
+    """
+
+    def factory(**kwargs: Any) -> Family:
+        return Family(
+            family_id=FAM_ID,
+            husband_id=HUSBAND_ID,
+            wife_id=WIFE_ID,
+            **kwargs,
+        )
+
+    return factory
+
+
+@pytest.fixture(scope="module")
+def shared_family(base_family_factory: Callable[..., Family]) -> Family:
+    """Couple canonique partagé par les tests en lecture seule"""
+    return base_family_factory()
+
+
+@pytest.fixture(scope="module")
+def family_with_child(base_family_factory: Callable[..., Family]) -> Family:
+    """Couple canonique avec un enfant, partagé en lecture seule"""
+    family = base_family_factory()
+    family.add_child("CORNO_Jean_0")
+    return family
+
+
+@pytest.fixture(scope="module")
+def family_with_events(base_family_factory: Callable[..., Family]) -> Family:
+    """Couple canonique avec mariage, divorce et fiançailles (lecture seule)"""
+    family = base_family_factory()
+    family.extend_events(
+        FamilyEvent(event_type=event_type, family_event_type=family_event_type)
+        for event_type, family_event_type in [
+            (EventType.MARRIAGE, FamilyEventType.MARRIAGE),
+            (EventType.DIVORCE, FamilyEventType.DIVORCE),
+            (EventType.ENGAGEMENT, FamilyEventType.ENGAGEMENT),
+        ]
+    )
+    return family
 
 
 class TestFamilyCreation:
     """Tests pour la création de familles"""
 
-    def test_create_simple_family(self):
+    def test_create_simple_family(self, shared_family):
         """Test création d'une famille simple"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
+        family = shared_family
 
-        assert family.family_id == "FAM001"
-        assert family.husband_id == "CORNO_Joseph_0"
-        assert family.wife_id == "THOMAS_Marie_0"
-        assert family.marriage_status == MarriageStatus.MARRIED
+        assert family.family_id == FAM_ID
+        assert family.husband_id == HUSBAND_ID
+        assert family.wife_id == WIFE_ID
+        assert family.marriage_status == MARRIED
 
-    def test_create_family_with_marriage_date(self):
-        """Test création avec date de mariage"""
-        marriage_date = Date.parse("10/08/2015")
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass(slots=True)")
+    def test_slots(self, shared_family):
+        """Family n'a pas de __dict__ par instance"""
+        assert not hasattr(shared_family, "__dict__")
 
-        family = Family(
-            family_id="FAM001",
-            husband_id="CORNO_Joseph_0",
-            wife_id="THOMAS_Marie_0",
-            marriage_date=marriage_date,
-        )
+    def test_create_family_with_marriage_date(self, base_family_factory):
+        """Test création avec date de mariage"""
+        family = base_family_factory(marriage_date=D_2015)
 
-        assert family.marriage_date == marriage_date
+        assert family.marriage_date == D_2015
 
-    def test_create_family_with_children(self):
+    def test_create_family_with_children(self, base_family_factory):
         """Test création avec enfants"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
+        family = base_family_factory()
 
-        family.add_child("CORNO_Jean_0", ChildSex.MALE)
-        family.add_child("CORNO_Sophie_0", ChildSex.FEMALE)
+        family.extend_children([("CORNO_Jean_0", MALE), ("CORNO_Sophie_0", FEMALE)])
 
         assert len(family.children) == 2
         assert family.child_ids == ["CORNO_Jean_0", "CORNO_Sophie_0"]
 
     def test_create_single_parent_family(self):
         """Test création famille monoparentale"""
-        family = Family(family_id="FAM002", husband_id="CORNO_Joseph_0")
+        family = Family(family_id="FAM002", husband_id=HUSBAND_ID)
 
-        assert family.husband_id == "CORNO_Joseph_0"
+        assert family.husband_id == HUSBAND_ID
         assert family.wife_id is None
 
+    @pytest.mark.parametrize("raw_id", [None, 1], ids=["none", "int"])
+    def test_non_str_ids_left_as_is(self, raw_id):
+        """Les identifiants non-str ne sont pas internés (pas de TypeError)"""
+        family = Family(family_id=raw_id, husband_id=raw_id, wife_id=WIFE_ID)
+        child = Child(person_id=raw_id)
+
+        assert family.family_id is raw_id
+        assert family.husband_id is raw_id
+        assert child.person_id is raw_id
+
 
 class TestFamilyValidation:
     """Tests pour la validation des familles"""
 
     def test_family_without_spouses(self):
         """Test famille sans époux (doit générer une erreur de validation)"""
-        family = Family(family_id="FAM001")
+        family = Family(family_id=FAM_ID)
         # Vérifier qu'une erreur de validation a été ajoutée
         assert len(family.validation_errors) > 0
-        assert any("au moins un époux" in str(err) for err in family.validation_errors)
+        assert NO_SPOUSE in family.validation_error_codes
 
-    def test_invalid_marriage_divorce_dates(self):
+    def test_invalid_marriage_divorce_dates(self, base_family_factory):
         """Test dates incohérentes (mariage > divorce)"""
-        family = Family(
-            family_id="FAM001",
-            husband_id="CORNO_Joseph_0",
-            wife_id="THOMAS_Marie_0",
-            marriage_date=Date.parse("10/08/2015"),
-            divorce_date=Date.parse("10/08/2010"),  # Avant le mariage
+        family = base_family_factory(
+            marriage_date=D_2015,
+            divorce_date=D_2010,  # Avant le mariage
         )
         # Vérifier qu'une erreur de validation a été ajoutée
         assert len(family.validation_errors) > 0
-        assert any("postérieure" in str(err) for err in family.validation_errors)
+        assert MARRIAGE_AFTER_DIVORCE in family.validation_error_codes
 
 
 class TestFamilyProperties:
     """Tests pour les propriétés des familles"""
 
-    def test_spouse_ids(self):
+    def test_spouse_ids(self, shared_family):
         """Test liste des IDs d'époux"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
-
-        assert family.spouse_ids == ["CORNO_Joseph_0", "THOMAS_Marie_0"]
+        assert shared_family.spouse_ids == [HUSBAND_ID, WIFE_ID]
 
-    def test_all_member_ids(self):
+    def test_all_member_ids(self, base_family_factory):
         """Test tous les membres de la famille"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
+        family = base_family_factory()
 
         family.add_child("CORNO_Jean_0")
 
-        expected = ["CORNO_Joseph_0", "THOMAS_Marie_0", "CORNO_Jean_0"]
+        expected = [HUSBAND_ID, WIFE_ID, "CORNO_Jean_0"]
         assert family.all_member_ids == expected
 
-    def test_is_married(self):
-        """Test statut marié"""
-        family = Family(
-            family_id="FAM001",
-            husband_id="CORNO_Joseph_0",
-            wife_id="THOMAS_Marie_0",
-            marriage_status=MarriageStatus.MARRIED,
-        )
-
-        assert family.is_married is True
-
-    def test_is_not_married(self):
-        """Test statut non marié"""
-        family = Family(
-            family_id="FAM001",
-            husband_id="CORNO_Joseph_0",
-            wife_id="THOMAS_Marie_0",
-            marriage_status=MarriageStatus.NOT_MARRIED,
-        )
+    @pytest.mark.parametrize(
+        "status,expected",
+        [(MARRIED, True), (NOT_MARRIED, False)],
+        ids=["married", "not_married"],
+    )
+    def test_is_married(self, base_family_factory, status, expected):
+        """Test statut marié selon marriage_status"""
+        family = base_family_factory(marriage_status=status)
 
-        assert family.is_married is False
+        assert family.is_married is expected
 
-    def test_is_divorced(self):
+    def test_is_divorced(self, base_family_factory):
         """Test statut divorcé"""
-        family = Family(
-            family_id="FAM001",
-            husband_id="CORNO_Joseph_0",
-            wife_id="THOMAS_Marie_0",
-            divorce_date=Date.parse("10/01/2020"),
-        )
+        family = base_family_factory(divorce_date=D_2020)
 
         assert family.is_divorced is True
 
@@ -139,27 +190,24 @@ class TestFamilyProperties:
 class TestFamilyMethods:
     """Tests pour les méthodes des familles"""
 
-    def test_add_child(self):
+    def test_add_child(self, base_family_factory):
         """Test ajout d'enfant"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
+        family = base_family_factory()
 
-        family.add_child("CORNO_Jean_0", ChildSex.MALE)
+        family.add_child("CORNO_Jean_0", MALE)
 
         assert len(family.children) == 1
         child = family.children[0]
         assert child.person_id == "CORNO_Jean_0"
-        assert child.sex == ChildSex.MALE
+        assert child.sex == MALE
 
-    def test_remove_child(self):
+    def test_remove_child(self, base_family_factory):
         """Test suppression d'enfant"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
+        family = base_family_factory()
 
-        family.add_child("CORNO_Jean_0")
-        family.add_child("CORNO_Sophie_0")
+        family.extend_children(
+            [("CORNO_Jean_0", UNKNOWN_SEX), ("CORNO_Sophie_0", UNKNOWN_SEX)]
+        )
 
         # Supprimer le premier enfant
         removed = family.remove_child("CORNO_Jean_0")
@@ -168,20 +216,16 @@ class TestFamilyMethods:
         assert len(family.children) == 1
         assert family.children[0].person_id == "CORNO_Sophie_0"
 
-    def test_remove_nonexistent_child(self):
+    def test_remove_nonexistent_child(self, shared_family):
         """Test suppression d'enfant inexistant"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
+        family = shared_family
 
         removed = family.remove_child("INEXISTANT_0")
         assert removed is False
 
-    def test_add_witness(self):
+    def test_add_witness(self, base_family_factory):
         """Test ajout de témoin"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
+        family = base_family_factory()
 
         family.add_witness("TEMOIN_Pierre_0", "m")
 
@@ -190,11 +234,9 @@ class TestFamilyMethods:
         assert witness["person_id"] == "TEMOIN_Pierre_0"
         assert witness["type"] == "m"
 
-    def test_add_comment(self):
+    def test_add_comment(self, base_family_factory):
         """Test ajout de commentaire"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
+        family = base_family_factory()
 
         family.add_comment("Mariage célébré à Paris")
 
@@ -205,72 +247,74 @@ class TestFamilyMethods:
 class TestFamilyRelations:
     """Tests pour les relations familiales"""
 
-    def test_spouse_method(self):
+    @pytest.mark.parametrize(
+        "person_id,expected",
+        [
+            (HUSBAND_ID, WIFE_ID),  # Le mari trouve sa femme
+            (WIFE_ID, HUSBAND_ID),  # La femme trouve son mari
+            ("INCONNU_0", None),  # Personne non membre
+        ],
+        ids=["husband", "wife", "stranger"],
+    )
+    def test_spouse_method(self, shared_family, person_id, expected):
         """Test méthode spouse"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
+        assert shared_family.spouse(person_id) == expected
+
+    @pytest.mark.parametrize(
+        "method,person_id,expected",
+        [
+            ("is_parent", HUSBAND_ID, True),
+            ("is_parent", WIFE_ID, True),
+            ("is_parent", "INCONNU_0", False),
+            ("is_parent", None, False),  # ID absent
+            ("is_child", "CORNO_Jean_0", True),
+            ("is_child", HUSBAND_ID, False),
+            ("is_member", HUSBAND_ID, True),  # Parent
+            ("is_member", "CORNO_Jean_0", True),  # Enfant
+            ("is_member", "INCONNU_0", False),  # Non membre
+        ],
+        ids=[
+            "parent_husband",
+            "parent_wife",
+            "parent_stranger",
+            "parent_none",
+            "child_child",
+            "child_parent",
+            "member_parent",
+            "member_child",
+            "member_stranger",
+        ],
+    )
+    def test_membership(self, family_with_child, method, person_id, expected):
+        """Test vérifications parent / enfant / membre"""
+        assert getattr(family_with_child, method)(person_id) is expected
+
+    def test_member_id_set(self, family_with_child):
+        """Test ensemble des membres pour les tests d'appartenance groupés"""
+        assert family_with_child.member_id_set == frozenset(
+            {HUSBAND_ID, WIFE_ID, "CORNO_Jean_0"}
         )
 
-        # Le mari trouve sa femme
-        spouse = family.spouse("CORNO_Joseph_0")
-        assert spouse == "THOMAS_Marie_0"
-
-        # La femme trouve son mari
-        spouse = family.spouse("THOMAS_Marie_0")
-        assert spouse == "CORNO_Joseph_0"
-
-        # Personne non membre
-        spouse = family.spouse("INCONNU_0")
-        assert spouse is None
-
-    def test_is_parent(self):
-        """Test vérification parent"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
-
-        assert family.is_parent("CORNO_Joseph_0") is True
-        assert family.is_parent("THOMAS_Marie_0") is True
-        assert family.is_parent("INCONNU_0") is False
-
-    def test_is_child(self):
-        """Test vérification enfant"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
-
-        family.add_child("CORNO_Jean_0")
-
-        assert family.is_child("CORNO_Jean_0") is True
-        assert family.is_child("CORNO_Joseph_0") is False
-
-    def test_is_member(self):
-        """Test vérification membre"""
-        family = Family(
-            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
-        )
-
-        family.add_child("CORNO_Jean_0")
-
-        assert family.is_member("CORNO_Joseph_0") is True  # Parent
-        assert family.is_member("CORNO_Jean_0") is True  # Enfant
-        assert family.is_member("INCONNU_0") is False  # Non membre
-
 
 class TestChild:
     """Tests pour la classe Child"""
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass(slots=True)")
+    def test_slots(self):
+        """Child n'a pas de __dict__ par instance"""
+        assert not hasattr(Child(person_id="CORNO_Jean_0"), "__dict__")
+
     def test_child_creation(self):
         """Test création d'enfant"""
-        child = Child(person_id="CORNO_Jean_0", sex=ChildSex.MALE, last_name="CORNO")
+        child = Child(person_id="CORNO_Jean_0", sex=MALE, last_name="CORNO")
 
         assert child.person_id == "CORNO_Jean_0"
-        assert child.sex == ChildSex.MALE
+        assert child.sex == MALE
         assert child.last_name == "CORNO"
 
     def test_child_string_representation(self):
         """Test représentation string de l'enfant"""
-        child = Child(person_id="CORNO_Jean_0", sex=ChildSex.MALE)
+        child = Child(person_id="CORNO_Jean_0", sex=MALE)
 
         expected = "-h CORNO_Jean_0"
         assert str(child) == expected
@@ -283,23 +327,17 @@ class TestChild:
 class TestFamilySerialization:
     """Tests pour la sérialisation des familles"""
 
-    def test_to_dict(self):
+    def test_to_dict(self, base_family_factory):
         """Test conversion en dictionnaire"""
-        family = Family(
-            family_id="FAM001",
-            husband_id="CORNO_Joseph_0",
-            wife_id="THOMAS_Marie_0",
-            marriage_date=Date.parse("10/08/2015"),
-            marriage_place="Paris",
-        )
+        family = base_family_factory(marriage_date=D_2015, marriage_place="Paris")
 
-        family.add_child("CORNO_Jean_0", ChildSex.MALE)
+        family.add_child("CORNO_Jean_0", MALE)
 
         data = family.to_dict()
 
-        assert data["family_id"] == "FAM001"
-        assert data["husband_id"] == "CORNO_Joseph_0"
-        assert data["wife_id"] == "THOMAS_Marie_0"
+        assert data["family_id"] == FAM_ID
+        assert data["husband_id"] == HUSBAND_ID
+        assert data["wife_id"] == WIFE_ID
         assert data["marriage_place"] == "Paris"
         assert len(data["children"]) == 1
         assert data["children"][0]["person_id"] == "CORNO_Jean_0"
@@ -312,7 +350,7 @@ class TestFamilyMissingCoverage:
         """Test Child avec nom de famille personnalisé."""
         child = Child(
             person_id="child001",
-            sex=ChildSex.MALE,
+            sex=MALE,
             last_name="CUSTOMNAME",
         )
         result = str(child)
@@ -325,11 +363,9 @@ class TestFamilyMissingCoverage:
         assert family.id == "FAM123"
         assert family.id == family.family_id
 
-    def test_add_event(self):
+    def test_add_event(self, base_family_factory):
         """Test ajout d'un événement familial."""
-        from geneweb_py.core.event import EventType, FamilyEvent, FamilyEventType
-
-        family = Family(family_id="FAM001")
+        family = base_family_factory()
         event = FamilyEvent(
             event_type=EventType.MARRIAGE,
             family_event_type=FamilyEventType.MARRIAGE,
@@ -339,67 +375,31 @@ class TestFamilyMissingCoverage:
         assert len(family.events) == 1
         assert family.events[0] == event
 
-    def test_get_events_by_event_type(self):
-        """Test récupération d'événements par EventType."""
-        from geneweb_py.core.event import EventType, FamilyEvent, FamilyEventType
-
-        family = Family(family_id="FAM001")
-
-        # Ajouter événement de mariage
-        marriage_event = FamilyEvent(
-            event_type=EventType.MARRIAGE,
-            family_event_type=FamilyEventType.MARRIAGE,
-        )
-        family.add_event(marriage_event)
-
-        # Ajouter événement de divorce
-        divorce_event = FamilyEvent(
-            event_type=EventType.DIVORCE,
-            family_event_type=FamilyEventType.DIVORCE,
-        )
-        family.add_event(divorce_event)
-
-        # Récupérer les événements de mariage via EventType
-        marriage_events = family.get_events_by_type(EventType.MARRIAGE)
-        assert len(marriage_events) == 1
-        assert marriage_events[0] == marriage_event
-
-    def test_get_events_by_family_event_type(self):
-        """Test récupération d'événements par FamilyEventType."""
-        from geneweb_py.core.event import EventType, FamilyEvent, FamilyEventType
-
-        family = Family(family_id="FAM001")
-
-        # Ajouter événement avec FamilyEventType
-        event = FamilyEvent(
-            event_type=EventType.ENGAGEMENT,
-            family_event_type=FamilyEventType.ENGAGEMENT,
-        )
-        family.add_event(event)
-
-        # Récupérer via FamilyEventType
-        events = family.get_events_by_type(FamilyEventType.ENGAGEMENT)
-        assert len(events) == 1
-        assert events[0] == event
-
-    def test_get_events_by_type_no_match(self):
-        """Test récupération d'événements sans correspondance."""
-        from geneweb_py.core.event import EventType
-
-        family = Family(family_id="FAM001")
-
-        # Pas d'événements de mariage
-        marriage_events = family.get_events_by_type(EventType.MARRIAGE)
-        assert len(marriage_events) == 0
-
-    def test_clear_validation_errors(self):
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            (EventType.MARRIAGE, [FamilyEventType.MARRIAGE]),
+            (EventType.DIVORCE, [FamilyEventType.DIVORCE]),
+            (FamilyEventType.ENGAGEMENT, [FamilyEventType.ENGAGEMENT]),
+            (EventType.PACS, []),  # Mappé mais absent
+            (EventType.BIRTH, []),  # Sans équivalent familial
+        ],
+        ids=[
+            "event_type",
+            "event_type_divorce",
+            "family_event_type",
+            "no_match",
+            "unmapped",
+        ],
+    )
+    def test_get_events_by_type(self, family_with_events, query, expected):
+        """Test récupération d'événements par EventType ou FamilyEventType."""
+        events = family_with_events.get_events_by_type(query)
+        assert [event.family_event_type for event in events] == expected
+
+    def test_clear_validation_errors(self, base_family_factory):
         """Test effacement des erreurs de validation."""
-        from geneweb_py.core.exceptions import GeneWebValidationError
-
-        family = Family(
-            family_id="FAM001",
-            husband_id="husband001",  # Avoir au moins un époux pour éviter validation auto  # noqa: E501
-        )
+        family = base_family_factory()  # Couple valide : aucune erreur initiale
 
         # Ajouter une erreur
         error = GeneWebValidationError("Test error")
@@ -414,42 +414,26 @@ class TestFamilyMissingCoverage:
         assert family.is_valid
         assert len(family.validation_errors) == 0
 
-    def test_family_str_with_spouses(self):
-        """Test représentation string d'une famille avec époux."""
-        family = Family(
-            family_id="FAM001",
-            husband_id="husband001",
-            wife_id="wife001",
-        )
-        family.add_child("child001", ChildSex.MALE)
-        family.add_child("child002", ChildSex.FEMALE)
-
-        result = str(family)
-
-        assert "husband001" in result
-        assert "wife001" in result
-        assert "2 enfants" in result
-
-    def test_family_str_with_only_husband(self):
-        """Test représentation string avec seulement un époux."""
-        family = Family(
-            family_id="FAM001",
-            husband_id="husband001",
-        )
-
-        result = str(family)
-
-        assert "husband001" in result
-        assert "0 enfants" in result
-
-    def test_family_str_with_only_wife(self):
-        """Test représentation string avec seulement une épouse."""
-        family = Family(
-            family_id="FAM001",
-            wife_id="wife001",
-        )
+    @pytest.mark.parametrize(
+        "husband_id,wife_id,children,must_contain",
+        [
+            (
+                "husband001",
+                "wife001",
+                [("child001", MALE), ("child002", FEMALE)],
+                ("husband001 + wife001", "2 enfants"),
+            ),
+            ("husband001", None, [], ("husband001", "0 enfants")),
+            (None, "wife001", [], ("wife001", "0 enfants")),
+        ],
+        ids=["spouses", "only_husband", "only_wife"],
+    )
+    def test_family_str(self, husband_id, wife_id, children, must_contain):
+        """Test représentation string selon les époux et enfants présents."""
+        family = Family(family_id=FAM_ID, husband_id=husband_id, wife_id=wife_id)
+        family.extend_children(children)
 
         result = str(family)
 
-        assert "wife001" in result
-        assert "0 enfants" in result
+        for expected in must_contain:
+            assert expected in result
@@ -35,6 +35,18 @@ class ConcreteImporter(BaseImporter):
         return Genealogy()
 
 
+@pytest.fixture(scope="module")
+def exporter():
+    """Exporteur concret sans état, partagé par les tests de validation"""
+    return ConcreteExporter()
+
+
+@pytest.fixture(scope="module")
+def importer():
+    """Importeur concret sans état, partagé par les tests de validation"""
+    return ConcreteImporter()
+
+
 class TestBaseExporter:
     """Tests pour la classe BaseExporter."""
 
@@ -43,27 +55,23 @@ class TestBaseExporter:
         exporter = ConcreteExporter(encoding="utf-8")
         assert exporter.encoding == "utf-8"
 
-    def test_validate_genealogy_valid(self):
+    def test_validate_genealogy_valid(self, exporter):
         """Test de validation d'une généalogie valide."""
-        exporter = ConcreteExporter()
         genealogy = Genealogy()
         genealogy.add_person(Person(last_name="TEST", first_name="Test"))
 
         # Ne doit pas lever d'exception
         exporter._validate_genealogy(genealogy)
 
-    def test_validate_genealogy_invalid_type(self):
+    def test_validate_genealogy_invalid_type(self, exporter):
         """Test de validation d'un objet invalide."""
-        exporter = ConcreteExporter()
-
         with pytest.raises(
             ConversionError, match="n'est pas une instance de Genealogy"
         ):
             exporter._validate_genealogy("invalid")
 
-    def test_validate_genealogy_empty(self):
+    def test_validate_genealogy_empty(self, exporter):
         """Test de validation d'une généalogie vide."""
-        exporter = ConcreteExporter()
         genealogy = Genealogy()
 
         with pytest.raises(ConversionError, match="La généalogie est vide"):
@@ -78,31 +86,22 @@ class TestBaseImporter:
         importer = ConcreteImporter(encoding="utf-8")
         assert importer.encoding == "utf-8"
 
-    def test_validate_file_path_valid(self):
+    @pytest.mark.slow
+    def test_validate_file_path_valid(self, importer, tmp_path: Path):
         """Test de validation d'un chemin de fichier valide."""
-        importer = ConcreteImporter()
-
-        # Créer un fichier temporaire
-        temp_file = Path("temp_test_file.txt")
+        temp_file = tmp_path / "temp_test_file.txt"
         temp_file.write_text("test content")
 
-        try:
-            result = importer._validate_file_path(temp_file)
-            assert result == temp_file
-        finally:
-            temp_file.unlink()
+        result = importer._validate_file_path(temp_file)
+        assert result == temp_file
 
-    def test_validate_file_path_nonexistent(self):
+    def test_validate_file_path_nonexistent(self, importer):
         """Test de validation d'un fichier inexistant."""
-        importer = ConcreteImporter()
-
         with pytest.raises(ConversionError, match="Le fichier n'existe pas"):
             importer._validate_file_path("nonexistent_file.txt")
 
-    def test_validate_file_path_not_file(self):
+    def test_validate_file_path_not_file(self, importer):
         """Test de validation d'un répertoire."""
-        importer = ConcreteImporter()
-
         with pytest.raises(ConversionError, match="n'est pas un fichier"):
             importer._validate_file_path(Path("."))
 
@@ -3,201 +3,210 @@ Tests unitaires pour les convertisseurs GEDCOM.
 """
 
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
 from geneweb_py.core.date import Date, DatePrefix
 from geneweb_py.core.event import EventType, FamilyEvent, FamilyEventType, PersonalEvent
+from geneweb_py.core.exceptions import GeneWebError
 from geneweb_py.core.family import Family, MarriageStatus
 from geneweb_py.core.genealogy import Genealogy
 from geneweb_py.core.person import Gender, Person, Title
 from geneweb_py.formats.gedcom import ConversionError, GEDCOMExporter, GEDCOMImporter
 
+# GEDCOM minimal (un individu DUPONT Jean) partagé par les tests d'import
+_SAMPLE_GEDCOM = """0 HEAD
+1 GEDC
+2 VERS 5.5.1
+2 FORM LINEAGE-LINKED
+1 CHAR UTF-8
+1 SOUR geneweb-py
+0 I0001 INDI
+1 NAME
+2 GIVN Jean
+2 SURN DUPONT
+1 SEX M
+0 TRLR"""
 
-class TestGEDCOMExporter:
-    """Tests pour la classe GEDCOMExporter."""
-
-    def test_init(self):
-        """Test de l'initialisation."""
-        exporter = GEDCOMExporter(encoding="utf-8", version="5.5.1")
-        assert exporter.encoding == "utf-8"
-        assert exporter.version == "5.5.1"
-
-    def test_export_to_string_simple(self):
-        """Test d'export vers chaîne simple."""
-        exporter = GEDCOMExporter()
-        genealogy = Genealogy()
-
-        person = Person(last_name="DUPONT", first_name="Jean", gender=Gender.MALE)
-        genealogy.add_person(person)
+# En-têtes des enregistrements de full_genealogy dans l'export (ordre d'ajout)
+JEAN_INDI = "0 I0001 INDI"
+FAMILY_FAM = "0 F0001 FAM"
 
-        result = exporter.export_to_string(genealogy)
 
-        # Vérifier que c'est du GEDCOM valide
-        lines = result.split("\n")
-        assert lines[0] == "0 HEAD"
-        assert "0 TRLR" in lines
+def _jean(**overrides: Any) -> Person:
+    """DUPONT Jean, la personne type des tests ; ``overrides`` complète les champs"""
+    return Person(last_name="DUPONT", first_name="Jean", **overrides)
 
-        # Vérifier la présence d'un individu
-        indi_lines = [line for line in lines if " INDI" in line]
-        assert len(indi_lines) == 1
 
-        # Vérifier les champs de base
-        assert any("1 NAME" in line for line in lines)
-        assert any("2 GIVN Jean" in line for line in lines)
-        assert any("2 SURN DUPONT" in line for line in lines)
-        assert any("1 SEX M" in line for line in lines)
+@pytest.fixture(scope="module")
+def full_genealogy():
+    """Généalogie construite une fois, partagée par les tests d'export
 
-    def test_export_to_string_with_dates(self):
-        """Test d'export avec des dates."""
-        exporter = GEDCOMExporter()
-        genealogy = Genealogy()
+    Couple DUPONT Jean + MARTIN Marie avec un enfant ; Jean porte des dates
+    de naissance/décès et un événement de diplôme. Les exporteurs ne la
+    modifient pas.
+    """
+    genealogy = Genealogy()
 
-        person = Person(
-            last_name="DUPONT",
-            first_name="Jean",
-            birth_date=Date(year=1950, month=3, day=15),
-            death_date=Date(year=2020, month=12, day=25),
+    husband = _jean(
+        gender=Gender.MALE,
+        birth_date=Date(year=1950, month=3, day=15),
+        death_date=Date(year=2020, month=12, day=25),
+    )
+    husband.add_event(
+        PersonalEvent(
+            event_type=EventType.GRADUATION,
+            date=Date(year=1972, month=6),
+            place="Université de Paris",
+            notes=["Diplôme d'ingénieur"],
         )
+    )
+    wife = Person(last_name="MARTIN", first_name="Marie", gender=Gender.FEMALE)
+    child = Person(last_name="DUPONT", first_name="Pierre", gender=Gender.MALE)
+    for person in (husband, wife, child):
         genealogy.add_person(person)
 
-        result = exporter.export_to_string(genealogy)
-        lines = result.split("\n")
+    family = Family(
+        family_id="FAM001", husband_id=husband.unique_id, wife_id=wife.unique_id
+    )
+    family.add_child(child.unique_id)
+    genealogy.add_family(family)
+    return genealogy
 
-        # Vérifier la présence de la personne et des dates
-        assert any("0 I0001 INDI" in line for line in lines)
-        assert any("2 GIVN Jean" in line for line in lines)
-        assert any("2 SURN DUPONT" in line for line in lines)
-        assert any("2 DATE 15 MAR 1950" in line for line in lines)
-        assert any("2 DATE 25 DEC 2020" in line for line in lines)
 
-    def test_export_to_string_with_family(self):
-        """Test d'export avec une famille."""
-        exporter = GEDCOMExporter()
-        genealogy = Genealogy()
+@pytest.fixture(scope="module")
+def exported_gedcom(full_genealogy):
+    """Export GEDCOM de la généalogie partagée"""
+    return GEDCOMExporter().export_to_string(full_genealogy)
 
-        husband = Person(last_name="DUPONT", first_name="Jean", gender=Gender.MALE)
-        wife = Person(last_name="MARTIN", first_name="Marie", gender=Gender.FEMALE)
-        child = Person(last_name="DUPONT", first_name="Pierre", gender=Gender.MALE)
 
-        genealogy.add_person(husband)
-        genealogy.add_person(wife)
-        genealogy.add_person(child)
+@pytest.fixture(scope="module")
+def exported_gedcom_lines(exported_gedcom):
+    """Export GEDCOM partagé, découpé en lignes"""
+    return exported_gedcom.splitlines()
 
-        family = Family(
-            family_id="FAM001", husband_id=husband.unique_id, wife_id=wife.unique_id
-        )
-        family.add_child(child)
-        genealogy.add_family(family)
 
-        result = exporter.export_to_string(genealogy)
-        lines = result.split("\n")
+@pytest.fixture(scope="module")
+def gedcom_records(exported_gedcom_lines):
+    """Enregistrements de niveau 0 de l'export partagé, indexés par leur en-tête
 
-        # Vérifier la présence d'une famille
-        fam_lines = [line for line in lines if " FAM" in line]
-        assert len(fam_lines) == 1
+    Chaque valeur contient la ligne ``0 ...`` et ses sous-lignes, jusqu'au
+    prochain enregistrement : un motif y est cherché pour une seule personne.
+    """
+    records = {}
+    for line in exported_gedcom_lines:
+        if line.startswith("0 "):
+            current = records.setdefault(line, [])
+        current.append(line)
+    return {header: "\n".join(lines) for header, lines in records.items()}
 
-        # Vérifier les relations familiales
-        assert any("1 HUSB" in line for line in lines)
-        assert any("1 WIFE" in line for line in lines)
-        assert any("1 CHIL" in line for line in lines)
 
-    def test_export_to_string_with_events(self):
-        """Test d'export avec des événements."""
-        exporter = GEDCOMExporter()
-        genealogy = Genealogy()
+@pytest.fixture(scope="module")
+def gedcom_exporter():
+    """Exporteur GEDCOM sans état, partagé par les tests de méthodes pures"""
+    return GEDCOMExporter()
 
-        person = Person(last_name="DUPONT", first_name="Jean")
 
-        event = PersonalEvent(
-            event_type=EventType.GRADUATION,
-            date=Date(year=1972, month=6),
-            place="Université de Paris",
-            notes=["Diplôme d'ingénieur"],
-        )
-        person.add_event(event)
-        genealogy.add_person(person)
+class TestGEDCOMExporter:
+    """Tests pour la classe GEDCOMExporter."""
 
-        result = exporter.export_to_string(genealogy)
-        lines = result.split("\n")
+    def test_init(self):
+        """Test de l'initialisation."""
+        exporter = GEDCOMExporter(encoding="utf-8", version="5.5.1")
+        assert exporter.encoding == "utf-8"
+        assert exporter.version == "5.5.1"
 
-        # Vérifier la présence d'un événement
-        assert any("1 GRAD" in line for line in lines)
-        assert any("2 DATE JUN 1972" in line for line in lines)
-        assert any("2 PLAC Université de Paris" in line for line in lines)
-        assert any("2 NOTE Diplôme d'ingénieur" in line for line in lines)
+    @pytest.mark.parametrize(
+        "record, needle",
+        [
+            # Individu et champs de base (enregistrement de Jean uniquement)
+            (JEAN_INDI, "1 NAME"),
+            (JEAN_INDI, "2 GIVN Jean"),
+            (JEAN_INDI, "2 SURN DUPONT"),
+            (JEAN_INDI, "1 SEX M"),
+            # Dates de naissance et de décès, rattachées à leur événement
+            (JEAN_INDI, "1 BIRT\n2 DATE 15 MAR 1950"),
+            (JEAN_INDI, "1 DEAT\n2 DATE 25 DEC 2020"),
+            # Événement personnel
+            (JEAN_INDI, "1 GRAD\n2 DATE JUN 1972"),
+            (JEAN_INDI, "2 PLAC Université de Paris"),
+            (JEAN_INDI, "2 NOTE Diplôme d'ingénieur"),
+            # Relations familiales
+            (FAMILY_FAM, "1 HUSB DUPONT_Jean_0"),
+            (FAMILY_FAM, "1 WIFE MARTIN_Marie_0"),
+            (FAMILY_FAM, "1 CHIL DUPONT_Pierre_0"),
+        ],
+    )
+    def test_export_to_string_contains(self, gedcom_records, record, needle):
+        """Test de la présence de chaque ligne attendue dans son enregistrement."""
+        assert needle in gedcom_records[record]
+
+    def test_export_to_string_structure(self, exported_gedcom_lines):
+        """Test de la structure de l'export (en-tête, individus, famille)."""
+        lines = exported_gedcom_lines
+        assert lines[0] == "0 HEAD"
+        assert lines[-1] == "0 TRLR"
+        assert len([line for line in lines if line.endswith(" INDI")]) == 3
+        assert len([line for line in lines if line.endswith(" FAM")]) == 1
 
-    def test_export_to_file(self):
+    @pytest.mark.slow
+    def test_export_to_file(self, gedcom_exporter, full_genealogy, tmp_path: Path):
         """Test d'export vers fichier."""
-        exporter = GEDCOMExporter()
-        genealogy = Genealogy()
+        temp_file = tmp_path / "temp_test.ged"
+        gedcom_exporter.export(full_genealogy, str(temp_file))
+        assert temp_file.exists()
 
-        person = Person(last_name="DUPONT", first_name="Jean")
-        genealogy.add_person(person)
-
-        temp_file = Path("temp_test.ged")
-
-        try:
-            exporter.export(genealogy, str(temp_file))
-            assert temp_file.exists()
+        # Vérifier le contenu
+        content = temp_file.read_text(encoding="utf-8")
+        assert "0 HEAD" in content
+        assert "0 TRLR" in content
 
-            # Vérifier le contenu
-            with open(temp_file, encoding="utf-8") as f:
-                content = f.read()
-            assert "0 HEAD" in content
-            assert "0 TRLR" in content
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
-
-    def test_export_empty_genealogy(self):
+    def test_export_empty_genealogy(self, gedcom_exporter):
         """Test d'export d'une généalogie vide."""
-        exporter = GEDCOMExporter()
         genealogy = Genealogy()
 
         with pytest.raises(ConversionError, match="La généalogie est vide"):
-            exporter.export_to_string(genealogy)
+            gedcom_exporter.export_to_string(genealogy)
 
-    def test_export_invalid_genealogy(self):
+    def test_export_invalid_genealogy(self, gedcom_exporter):
         """Test d'export d'un objet invalide."""
-        exporter = GEDCOMExporter()
-
         with pytest.raises(
             ConversionError, match="n'est pas une instance de Genealogy"
         ):
-            exporter.export_to_string("invalid")
-
-    def test_map_event_type(self):
+            gedcom_exporter.export_to_string("invalid")
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            # Mappings valides
+            ("birth", "BIRT"),
+            ("death", "DEAT"),
+            ("marriage", "MARR"),
+            ("divorce", "DIV"),
+            ("graduation", "GRAD"),
+            # Types non mappés
+            ("unknown", None),
+            pytest.param("", None, id="empty"),
+        ],
+    )
+    def test_map_event_type(self, gedcom_exporter, raw, expected):
         """Test du mapping des types d'événements."""
-        exporter = GEDCOMExporter()
-
-        # Test des mappings valides
-        assert exporter._map_event_type("birth") == "BIRT"
-        assert exporter._map_event_type("death") == "DEAT"
-        assert exporter._map_event_type("marriage") == "MARR"
-        assert exporter._map_event_type("divorce") == "DIV"
-        assert exporter._map_event_type("graduation") == "GRAD"
-
-        # Test des types non mappés
-        assert exporter._map_event_type("unknown") is None
-        assert exporter._map_event_type("") is None
-
-    def test_format_gedcom_date(self):
+        assert gedcom_exporter._map_event_type(raw) == expected
+
+    @pytest.mark.parametrize(
+        "date,expected",
+        [
+            (Date(year=1950, month=3, day=15), "15 MAR 1950"),
+            (Date(year=1950, month=3), "MAR 1950"),
+            (Date(year=1950), "1950"),
+        ],
+        ids=["complete", "no_day", "year_only"],
+    )
+    def test_format_gedcom_date(self, gedcom_exporter, date, expected):
         """Test du formatage des dates GEDCOM."""
-        exporter = GEDCOMExporter()
-
-        # Date complète
-        date = Date(year=1950, month=3, day=15)
-        assert exporter._format_gedcom_date(date) == "15 MAR 1950"
-
-        # Date sans jour
-        date = Date(year=1950, month=3)
-        assert exporter._format_gedcom_date(date) == "MAR 1950"
-
-        # Date sans mois
-        date = Date(year=1950)
-        assert exporter._format_gedcom_date(date) == "1950"
+        assert gedcom_exporter._format_gedcom_date(date) == expected
 
 
 class TestGEDCOMImporter:
@@ -212,20 +221,7 @@ class TestGEDCOMImporter:
         """Test d'import depuis chaîne simple."""
         importer = GEDCOMImporter()
 
-        gedcom_string = """0 HEAD
-1 GEDC
-2 VERS 5.5.1
-2 FORM LINEAGE-LINKED
-1 CHAR UTF-8
-1 SOUR geneweb-py
-0 I0001 INDI
-1 NAME
-2 GIVN Jean
-2 SURN DUPONT
-1 SEX M
-0 TRLR"""
-
-        genealogy = importer.import_from_string(gedcom_string)
+        genealogy = importer.import_from_string(_SAMPLE_GEDCOM)
 
         assert len(genealogy.persons) == 1
         p = genealogy.find_person("DUPONT", "Jean", 0)
@@ -234,35 +230,17 @@ class TestGEDCOMImporter:
         assert p.first_name == "Jean"
         assert p.last_name == "DUPONT"
 
-    def test_import_from_file(self):
+    @pytest.mark.slow
+    def test_import_from_file(self, tmp_path: Path):
         """Test d'import depuis fichier."""
         importer = GEDCOMImporter()
 
-        gedcom_string = """0 HEAD
-1 GEDC
-2 VERS 5.5.1
-2 FORM LINEAGE-LINKED
-1 CHAR UTF-8
-1 SOUR geneweb-py
-0 I0001 INDI
-1 NAME
-2 GIVN Jean
-2 SURN DUPONT
-1 SEX M
-0 TRLR"""
+        temp_file = tmp_path / "temp_test.ged"
+        temp_file.write_text(_SAMPLE_GEDCOM, encoding="utf-8")
 
-        temp_file = Path("temp_test.ged")
-
-        try:
-            with open(temp_file, "w", encoding="utf-8") as f:
-                f.write(gedcom_string)
-
-            genealogy = importer.import_from_file(str(temp_file))
-            assert len(genealogy.persons) == 1
-            assert genealogy.find_person("DUPONT", "Jean", 0) is not None
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        genealogy = importer.import_from_file(str(temp_file))
+        assert len(genealogy.persons) == 1
+        assert genealogy.find_person("DUPONT", "Jean", 0) is not None
 
     def test_import_invalid_gedcom(self):
         """Test d'import de GEDCOM invalide (parsing gracieux)."""
@@ -293,14 +271,10 @@ class TestGEDCOMImporter:
 
     def test_conversion_error_is_geneweb_error(self):
         """Les erreurs d'import GEDCOM héritent de GeneWebError."""
-        from geneweb_py.core.exceptions import GeneWebError
-
         assert issubclass(ConversionError, GeneWebError)
 
     def test_import_duplicate_indi_raises(self):
         """Deux blocs INDI avec la même xref lèvent ConversionError."""
-        from geneweb_py.core.exceptions import GeneWebError
-
         importer = GEDCOMImporter()
         ged = """0 HEAD
 1 CHAR UTF-8
@@ -326,9 +300,10 @@ class TestGEDCOMImporter:
 class TestGEDCOMExporterCoverage:
     """Branches non couvertes de GEDCOMExporter."""
 
-    def test_export_person_with_death_place(self) -> None:
+    def test_export_person_with_death_place(
+        self, gedcom_exporter: GEDCOMExporter
+    ) -> None:
         """Ligne 183 : person.death_place exporté."""
-        exporter = GEDCOMExporter()
         genealogy = Genealogy()
         person = Person(
             last_name="DURAND",
@@ -336,42 +311,40 @@ class TestGEDCOMExporterCoverage:
             death_place="Lyon",
         )
         genealogy.add_person(person)
-        result = exporter.export_to_string(genealogy)
+        result = gedcom_exporter.export_to_string(genealogy)
         assert "2 PLAC Lyon" in result
 
-    def test_export_person_with_titles(self) -> None:
+    def test_export_person_with_titles(self, gedcom_exporter: GEDCOMExporter) -> None:
         """Lignes 187-188 : titles exportés."""
-        exporter = GEDCOMExporter()
         genealogy = Genealogy()
         person = Person(last_name="BLANC", first_name="Paul")
         person.titles.append(Title(name="Docteur"))
         genealogy.add_person(person)
-        result = exporter.export_to_string(genealogy)
+        result = gedcom_exporter.export_to_string(genealogy)
         assert "1 TITL Docteur" in result
 
-    def test_export_person_with_occupation(self) -> None:
+    def test_export_person_with_occupation(
+        self, gedcom_exporter: GEDCOMExporter
+    ) -> None:
         """Ligne 191 : occupation exportée."""
-        exporter = GEDCOMExporter()
         genealogy = Genealogy()
         person = Person(last_name="NOIR", first_name="Luc", occupation="Médecin")
         genealogy.add_person(person)
-        result = exporter.export_to_string(genealogy)
+        result = gedcom_exporter.export_to_string(genealogy)
         assert "1 OCCU Médecin" in result
 
-    def test_export_person_with_notes(self) -> None:
+    def test_export_person_with_notes(self, gedcom_exporter: GEDCOMExporter) -> None:
         """Lignes 195-197 : notes exportées avec CONT."""
-        exporter = GEDCOMExporter()
         genealogy = Genealogy()
         person = Person(last_name="VERT", first_name="Claire")
         person.notes.append("Note importante")
         genealogy.add_person(person)
-        result = exporter.export_to_string(genealogy)
+        result = gedcom_exporter.export_to_string(genealogy)
         assert "1 NOTE" in result
         assert "2 CONT Note importante" in result
 
-    def test_export_family_with_events(self) -> None:
+    def test_export_family_with_events(self, gedcom_exporter: GEDCOMExporter) -> None:
         """Lignes 229-230 : événements familiaux exportés."""
-        exporter = GEDCOMExporter()
         genealogy = Genealogy()
         husband = Person(last_name="PETIT", first_name="Henri", gender=Gender.MALE)
         wife = Person(last_name="GRAND", first_name="Anne", gender=Gender.FEMALE)
@@ -391,7 +364,7 @@ class TestGEDCOMExporterCoverage:
         )
         family.events.append(fe)
         genealogy.add_family(family)
-        result = exporter.export_to_string(genealogy)
+        result = gedcom_exporter.export_to_string(genealogy)
         assert "1 MARR" in result
         assert "2 DATE 15 JUN 1980" in result
         assert "2 PLAC Paris" in result
@@ -734,7 +707,7 @@ class TestGEDCOMImporterCoverage:
         """Ligne 872 : résolution via _xref_to_uid."""
         importer = GEDCOMImporter()
         genealogy = Genealogy()
-        p = Person(last_name="DUPONT", first_name="Jean")
+        p = _jean()
         genealogy.add_person(p)
         importer._xref_to_uid["I1"] = p.unique_id
         result = importer._resolve_person_pointer("@I1@", genealogy)
@@ -744,7 +717,7 @@ class TestGEDCOMImporterCoverage:
         """Ligne 874 : résolution directe via genealogy.persons."""
         importer = GEDCOMImporter()
         genealogy = Genealogy()
-        p = Person(last_name="DUPONT", first_name="Jean")
+        p = _jean()
         genealogy.add_person(p)
         result = importer._resolve_person_pointer(p.unique_id, genealogy)
         assert result == p.unique_id
@@ -3,6 +3,7 @@ Tests unitaires pour les convertisseurs JSON.
 """
 
 import json
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -12,9 +13,22 @@ from geneweb_py.core.event import Event, EventType
 from geneweb_py.core.family import Family
 from geneweb_py.core.genealogy import Genealogy
 from geneweb_py.core.person import Gender, Person
+from geneweb_py.formats import json as json_format
 from geneweb_py.formats.json import ConversionError, JSONExporter, JSONImporter
 
 
+@pytest.fixture(scope="module")
+def exporter():
+    """Exporteur JSON sans état, partagé par les tests du module"""
+    return JSONExporter()
+
+
+@pytest.fixture(scope="module")
+def importer():
+    """Importeur JSON partagé (tables internes remises à zéro à chaque import)"""
+    return JSONImporter()
+
+
 class TestJSONExporter:
     """Tests pour la classe JSONExporter."""
 
@@ -25,9 +39,8 @@ class TestJSONExporter:
         assert exporter.indent == 4
         assert exporter.ensure_ascii is True
 
-    def test_export_to_string_simple(self):
+    def test_export_to_string_simple(self, exporter):
         """Test d'export vers chaîne simple."""
-        exporter = JSONExporter()
         genealogy = Genealogy()
 
         person = Person(last_name="DUPONT", first_name="Jean", gender=Gender.MALE)
@@ -45,9 +58,8 @@ class TestJSONExporter:
         assert data["persons"][0]["first_name"] == "Jean"
         assert data["persons"][0]["gender"] == "m"
 
-    def test_export_to_string_with_dates(self):
+    def test_export_to_string_with_dates(self, exporter):
         """Test d'export avec des dates."""
-        exporter = JSONExporter()
         genealogy = Genealogy()
 
         person = Person(
@@ -69,23 +81,20 @@ class TestJSONExporter:
         assert person_data["death_date"]["month"] == 12
         assert person_data["death_date"]["day"] == 25
 
-    def test_export_to_string_with_family(self):
+    def test_export_to_string_with_family(self, exporter):
         """Test d'export avec une famille."""
-        exporter = JSONExporter()
         genealogy = Genealogy()
 
         husband = Person(last_name="DUPONT", first_name="Jean", gender=Gender.MALE)
         wife = Person(last_name="MARTIN", first_name="Marie", gender=Gender.FEMALE)
         child = Person(last_name="DUPONT", first_name="Pierre", gender=Gender.MALE)
 
-        genealogy.add_person(husband)
-        genealogy.add_person(wife)
-        genealogy.add_person(child)
+        genealogy.extend_persons([husband, wife, child])
 
         family = Family(
             family_id="FAM001", husband_id=husband.unique_id, wife_id=wife.unique_id
         )
-        family.add_child(child)
+        family.add_child(child.unique_id)
         genealogy.add_family(family)
 
         result = exporter.export_to_string(genealogy)
@@ -99,22 +108,9 @@ class TestJSONExporter:
         assert family_data["wife_id"] is not None
         assert len(family_data["children"]) == 1
 
-    def test_export_to_string_with_events(self):
+    def test_export_to_string_with_events(self, exporter, jean_genealogy):
         """Test d'export avec des événements."""
-        exporter = JSONExporter()
-        genealogy = Genealogy()
-
-        person = Person(last_name="DUPONT", first_name="Jean")
-        event = Event(
-            event_type=EventType.GRADUATION,
-            date=Date(year=1972, month=6),
-            place="Université de Paris",
-            notes=["Diplôme d'ingénieur"],
-        )
-        person.add_event(event)
-        genealogy.add_person(person)
-
-        result = exporter.export_to_string(genealogy)
+        result = exporter.export_to_string(jean_genealogy)
         data = json.loads(result)
 
         person_data = data["persons"][0]
@@ -124,44 +120,73 @@ class TestJSONExporter:
         assert event_data["place"] == "Université de Paris"
         assert event_data["notes"] == ["Diplôme d'ingénieur"]
 
-    def test_export_to_file(self):
+    def test_export_to_file(self, exporter, tmp_path: Path):
         """Test d'export vers fichier."""
-        exporter = JSONExporter()
         genealogy = Genealogy()
 
         person = Person(last_name="DUPONT", first_name="Jean")
         genealogy.add_person(person)
 
-        temp_file = Path("temp_test.json")
-
-        try:
-            exporter.export(genealogy, str(temp_file))
-            assert temp_file.exists()
+        temp_file = tmp_path / "temp_test.json"
+        exporter.export(genealogy, str(temp_file))
+        assert temp_file.exists()
 
-            # Vérifier le contenu
-            with open(temp_file, encoding="utf-8") as f:
-                data = json.load(f)
-            assert len(data["persons"]) == 1
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        # Vérifier le contenu
+        with open(temp_file, encoding="utf-8") as f:
+            data = json.load(f)
+        assert len(data["persons"]) == 1
 
-    def test_export_empty_genealogy(self):
-        """Test d'export d'une généalogie vide."""
-        exporter = JSONExporter()
+    @staticmethod
+    def _export_both(exporter, monkeypatch, metadata=None):
+        """Exporte la même généalogie avec orjson puis avec json.dumps"""
+        pytest.importorskip("orjson")
         genealogy = Genealogy()
+        person = Person(
+            last_name="LÉVÊQUE",
+            first_name="Hélène",
+            birth_date=Date(year=1950, month=3, day=15),
+        )
+        person.add_event(
+            Event(
+                event_type=EventType.GRADUATION,
+                notes=["École"],
+                metadata=metadata or {},
+            )
+        )
+        genealogy.add_person(person)
 
-        with pytest.raises(ConversionError, match="La généalogie est vide"):
-            exporter.export_to_string(genealogy)
-
-    def test_export_invalid_genealogy(self):
-        """Test d'export d'un objet invalide."""
-        exporter = JSONExporter()
-
-        with pytest.raises(
-            ConversionError, match="n'est pas une instance de Genealogy"
-        ):
-            exporter.export_to_string("invalid")
+        fast = exporter.export_to_string(genealogy)
+        with monkeypatch.context() as m:
+            m.setattr(json_format, "orjson", None)
+            slow = exporter.export_to_string(genealogy)
+        return fast, slow
+
+    @pytest.mark.parametrize(
+        "metadata",
+        [
+            None,
+            {"when": datetime(2020, 1, 2, 3, 4, 5)},  # Passthrough -> default=str
+            {"big": 2**70},  # Refusé par orjson -> repli json.dumps
+        ],
+        ids=["schema", "datetime", "int_over_64_bits"],
+    )
+    def test_export_orjson_matches_stdlib(self, exporter, monkeypatch, metadata):
+        """Le chemin orjson produit exactement la sortie de json.dumps."""
+        fast, slow = self._export_both(exporter, monkeypatch, metadata)
+        assert fast == slow
+
+    def test_export_orjson_float_notation(self, exporter, monkeypatch):
+        """Flottant libre : notation différente, même valeur décodée."""
+        fast, slow = self._export_both(exporter, monkeypatch, {"f": 1e16})
+        assert json.loads(fast) == json.loads(slow)
+
+    def test_export_orjson_enum_in_free_field(self, exporter, monkeypatch):
+        """Enum dans un champ libre : orjson écrit sa valeur (différence connue)."""
+        fast, slow = self._export_both(exporter, monkeypatch, {"k": EventType.BIRTH})
+        fast_event = json.loads(fast)["persons"][0]["events"][0]
+        slow_event = json.loads(slow)["persons"][0]["events"][0]
+        assert fast_event["metadata"] == {"k": "birt"}
+        assert slow_event["metadata"] == {"k": "EventType.BIRTH"}
 
 
 class TestJSONImporter:
@@ -172,10 +197,8 @@ class TestJSONImporter:
         importer = JSONImporter(encoding="utf-8")
         assert importer.encoding == "utf-8"
 
-    def test_import_from_string_simple(self):
+    def test_import_from_string_simple(self, importer):
         """Test d'import depuis chaîne simple."""
-        importer = JSONImporter()
-
         json_data = {
             "metadata": {"version": "1.0.0"},
             "persons": [
@@ -188,15 +211,66 @@ class TestJSONImporter:
         genealogy = importer.import_from_string(json_string)
 
         assert len(genealogy.persons) == 1
-        person = list(genealogy.persons.values())[0]
+        person = next(iter(genealogy.persons.values()))
         assert person.last_name == "DUPONT"
         assert person.first_name == "Jean"
         assert person.gender == Gender.MALE
 
-    def test_import_from_string_with_dates(self):
-        """Test d'import avec des dates."""
-        importer = JSONImporter()
+    def test_import_from_bytes(self, importer):
+        """Test d'import depuis des octets UTF-8."""
+        json_bytes = json.dumps(
+            {"persons": [{"id": 1, "last_name": "LÉVÊQUE", "first_name": "Hélène"}]},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        genealogy = importer.import_from_string(json_bytes)
+
+        person = next(iter(genealogy.persons.values()))
+        assert person.last_name == "LÉVÊQUE"
+        assert person.first_name == "Hélène"
+
+    @pytest.mark.parametrize(
+        "family_data",
+        [
+            {"family_id": 1, "husband_id": "DUPONT_Jean_0"},
+            {"family_id": None, "husband_id": "DUPONT_Jean_0"},
+            {
+                "family_id": "FAM001",
+                "husband_id": "DUPONT_Jean_0",
+                "children": [{"person_id": None}],
+            },
+        ],
+        ids=["int_family_id", "null_family_id", "null_child_id"],
+    )
+    def test_import_non_str_ids(self, importer, family_data):
+        """Des identifiants non-str n'empêchent pas l'import"""
+        genealogy = importer.import_from_string(
+            json.dumps({"persons": [], "families": [family_data]})
+        )
 
+        assert len(genealogy.families) == 1
+
+    def test_import_numeric_places(self, importer):
+        """Des lieux numériques (JSON peu typé) sont conservés tels quels"""
+        json_string = json.dumps(
+            {
+                "persons": [
+                    {
+                        "id": 1,
+                        "last_name": "DUPONT",
+                        "first_name": "Jean",
+                        "birth_place": 75000,
+                        "events": [{"event_type": "grad", "place": 12}],
+                    }
+                ]
+            }
+        )
+        person = next(iter(importer.import_from_string(json_string).persons.values()))
+
+        assert person.birth_place == 75000
+        assert person.events[0].place == 12
+
+    def test_import_from_string_with_dates(self, importer):
+        """Test d'import avec des dates."""
         json_data = {
             "metadata": {"version": "1.0.0"},
             "persons": [
@@ -214,7 +288,7 @@ class TestJSONImporter:
         json_string = json.dumps(json_data)
         genealogy = importer.import_from_string(json_string)
 
-        person = list(genealogy.persons.values())[0]
+        person = next(iter(genealogy.persons.values()))
         assert person.birth_date.year == 1950
         assert person.birth_date.month == 3
         assert person.birth_date.day == 15
@@ -222,10 +296,8 @@ class TestJSONImporter:
         assert person.death_date.month == 12
         assert person.death_date.day == 25
 
-    def test_import_from_string_with_events(self):
+    def test_import_from_string_with_events(self, importer):
         """Test d'import avec des événements."""
-        importer = JSONImporter()
-
         json_data = {
             "metadata": {"version": "1.0.0"},
             "persons": [
@@ -249,7 +321,7 @@ class TestJSONImporter:
         json_string = json.dumps(json_data)
         genealogy = importer.import_from_string(json_string)
 
-        person = list(genealogy.persons.values())[0]
+        person = next(iter(genealogy.persons.values()))
         assert len(person.events) == 1
         event = person.events[0]
         assert event.event_type == EventType.GRADUATION
@@ -258,78 +330,28 @@ class TestJSONImporter:
         assert event.date.year == 1972
         assert event.date.month == 6
 
-    def test_import_from_file(self):
+    def test_import_from_file(self, importer, tmp_path: Path):
         """Test d'import depuis fichier."""
-        importer = JSONImporter()
-
         json_data = {
             "metadata": {"version": "1.0.0"},
             "persons": [{"id": 1, "last_name": "DUPONT", "first_name": "Jean"}],
             "families": [],
         }
 
-        temp_file = Path("temp_test.json")
+        temp_file = tmp_path / "temp_test.json"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(json_data, f)
 
-        try:
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(json_data, f)
-
-            genealogy = importer.import_from_file(str(temp_file))
-            assert len(genealogy.persons) == 1
-            assert list(genealogy.persons.values())[0].last_name == "DUPONT"
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
-
-    def test_import_invalid_json(self):
-        """Test d'import de JSON invalide."""
-        importer = JSONImporter()
+        genealogy = importer.import_from_file(str(temp_file))
+        assert len(genealogy.persons) == 1
+        assert next(iter(genealogy.persons.values())).last_name == "DUPONT"
 
-        with pytest.raises(ConversionError, match="Erreur lors du parsing JSON"):
+    def test_import_invalid_json(self, importer):
+        """Test d'import de JSON invalide (rejeté dès le premier caractère)."""
+        with pytest.raises(ConversionError, match="ne commence pas par"):
             importer.import_from_string("invalid json")
 
-    def test_import_nonexistent_file(self):
-        """Test d'import d'un fichier inexistant."""
-        importer = JSONImporter()
-
-        with pytest.raises(ConversionError, match="Le fichier n'existe pas"):
-            importer.import_from_file("nonexistent.json")
-
-    def test_roundtrip_export_import(self):
-        """Test d'export puis import (roundtrip)."""
-        # Créer une généalogie
-        genealogy = Genealogy()
-        person = Person(
-            last_name="DUPONT",
-            first_name="Jean",
-            gender=Gender.MALE,
-            birth_date=Date(year=1950, month=3, day=15),
-            birth_place="Paris, France",
-        )
-        event = Event(
-            event_type=EventType.GRADUATION,
-            date=Date(year=1972, month=6),
-            place="Université de Paris",
-            notes=["Diplôme d'ingénieur"],
-        )
-        person.add_event(event)
-        genealogy.add_person(person)
-
-        # Exporter
-        exporter = JSONExporter()
-        json_string = exporter.export_to_string(genealogy)
-
-        # Importer
-        importer = JSONImporter()
-        imported_genealogy = importer.import_from_string(json_string)
-
-        # Vérifier que les données sont identiques
-        assert len(imported_genealogy.persons) == 1
-        imported_person = list(imported_genealogy.persons.values())[0]
-        assert imported_person.last_name == "DUPONT"
-        assert imported_person.first_name == "Jean"
-        assert imported_person.gender == Gender.MALE
-        assert imported_person.birth_date.year == 1950
-        assert imported_person.birth_place == "Paris, France"
-        assert len(imported_person.events) == 1
-        assert imported_person.events[0].event_type == EventType.GRADUATION
+    def test_import_malformed_json_object(self, importer):
+        """Un objet tronqué passe le contrôle initial et échoue au parsing."""
+        with pytest.raises(ConversionError, match="Erreur lors du parsing JSON"):
+            importer.import_from_string('  {"persons": [')
@@ -0,0 +1,114 @@
+"""
+Tests unitaires pour les convertisseurs MessagePack.
+"""
+
+import io
+
+import pytest
+
+pytest.importorskip("msgpack")
+
+from geneweb_py.core.date import Date
+from geneweb_py.core.event import Event, EventType
+from geneweb_py.core.family import Family
+from geneweb_py.core.genealogy import Genealogy
+from geneweb_py.core.person import Gender, Person
+from geneweb_py.formats.json import JSONExporter
+from geneweb_py.formats.msgpack import (
+    ConversionError,
+    MsgpackExporter,
+    MsgpackImporter,
+)
+
+
+@pytest.fixture(scope="module")
+def genealogy() -> Genealogy:
+    """Généalogie avec personnes, dates, événement et famille."""
+    genealogy = Genealogy()
+    husband = Person(
+        last_name="DUPONT",
+        first_name="Jean",
+        gender=Gender.MALE,
+        birth_date=Date(year=1950, month=3, day=15),
+        birth_place="Paris, France",
+    )
+    husband.add_event(
+        Event(
+            event_type=EventType.GRADUATION,
+            date=Date(year=1972, month=6),
+            notes=["Diplôme d'ingénieur"],
+        )
+    )
+    wife = Person(last_name="MARTIN", first_name="Hélène", gender=Gender.FEMALE)
+    genealogy.add_person(husband)
+    genealogy.add_person(wife)
+    genealogy.add_family(
+        Family(
+            family_id="FAM001",
+            husband_id=husband.unique_id,
+            wife_id=wife.unique_id,
+            marriage_date=Date(year=1975),
+        )
+    )
+    return genealogy
+
+
+class TestMsgpackExporter:
+    """Tests pour la classe MsgpackExporter."""
+
+    def test_export_to_bytes_smaller_than_json(self, genealogy):
+        """Le document binaire est plus compact que le JSON indenté."""
+        packed = MsgpackExporter().export_to_bytes(genealogy)
+
+        assert isinstance(packed, bytes)
+        assert len(packed) < len(JSONExporter().export_to_string(genealogy))
+
+    def test_export_to_string_unsupported(self, genealogy):
+        """Test du refus de l'export texte."""
+        with pytest.raises(ConversionError, match="format binaire"):
+            MsgpackExporter().export_to_string(genealogy)
+
+    def test_export_empty_genealogy(self):
+        """Test d'export d'une généalogie vide."""
+        with pytest.raises(ConversionError, match="La généalogie est vide"):
+            MsgpackExporter().export_to_bytes(Genealogy())
+
+
+class TestMsgpackImporter:
+    """Tests pour la classe MsgpackImporter."""
+
+    def test_roundtrip_file(self, genealogy, tmp_path):
+        """Test d'export puis import via fichier."""
+        output = tmp_path / "genealogy.msgpack"
+        MsgpackExporter().export(genealogy, output)
+
+        imported = MsgpackImporter().import_from_file(output)
+
+        assert len(imported.persons) == 2
+        assert len(imported.families) == 1
+        person = imported.find_person("DUPONT", "Jean")
+        assert person.birth_date.day == 15
+        assert person.events[0].event_type == EventType.GRADUATION
+        family = next(iter(imported.families.values()))
+        assert family.marriage_date.year == 1975
+
+    def test_roundtrip_stream(self, genealogy):
+        """Test d'export puis import en mémoire."""
+        buffer = io.BytesIO()
+        MsgpackExporter().export_to_stream(genealogy, buffer)
+        buffer.seek(0)
+
+        imported = MsgpackImporter().import_from_stream(buffer)
+
+        assert len(imported.persons) == 2
+        assert len(imported.families) == 1
+
+    def test_import_from_string_requires_bytes(self):
+        """Test du refus d'une chaîne str."""
+        with pytest.raises(ConversionError, match="format binaire"):
+            MsgpackImporter().import_from_string("{}")
+
+    def test_import_invalid_bytes(self):
+        """Test d'import de données invalides."""
+        with pytest.raises(ConversionError, match="Erreur lors du parsing"):
+            MsgpackImporter().import_from_bytes(b"\xc1")
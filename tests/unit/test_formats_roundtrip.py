@@ -0,0 +1,101 @@
+"""
+Tests communs aux convertisseurs texte JSON et XML.
+
+Les scénarios identiques d'un format à l'autre (aller-retour, généalogie
+vide ou invalide, fichier absent) sont paramétrés ici ; les tests propres
+à chaque format restent dans ``test_formats_json.py`` et
+``test_xml_format_support.py``.
+"""
+
+import io
+
+import pytest
+
+from geneweb_py.core.event import EventType
+from geneweb_py.core.genealogy import Genealogy
+from geneweb_py.core.person import Gender
+from geneweb_py.formats.base import ConversionError
+from geneweb_py.formats.json import JSONExporter, JSONImporter
+from geneweb_py.formats.xml import XMLExporter, XMLImporter
+
+FORMATS = {
+    "json": (JSONExporter, JSONImporter),
+    "xml": (XMLExporter, XMLImporter),
+}
+
+
+@pytest.fixture(scope="module", params=list(FORMATS))
+def fmt(request):
+    """Nom du format testé"""
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def exporter(fmt):
+    """Exporteur sans état du format testé"""
+    return FORMATS[fmt][0]()
+
+
+@pytest.fixture(scope="module")
+def importer(fmt):
+    """Importeur du format testé (état remis à zéro à chaque import)"""
+    return FORMATS[fmt][1]()
+
+
+def test_roundtrip_export_import(exporter, importer, jean_genealogy):
+    """Test d'export puis import (roundtrip)."""
+    content = exporter.export_to_string(jean_genealogy)
+    imported_genealogy = importer.import_from_string(content)
+
+    assert len(imported_genealogy.persons) == 1
+    imported_person = next(iter(imported_genealogy.persons.values()))
+    assert imported_person.last_name == "DUPONT"
+    assert imported_person.first_name == "Jean"
+    assert imported_person.gender == Gender.MALE
+    assert imported_person.birth_date.year == 1950
+    assert imported_person.birth_place == "Paris, France"
+    assert len(imported_person.events) == 1
+    assert imported_person.events[0].event_type == EventType.GRADUATION
+
+
+def test_stream_roundtrip(exporter, importer, jean_genealogy):
+    """Aller-retour en mémoire via export_to_stream / import_from_stream."""
+    buffer = io.BytesIO()
+    exporter.export_to_stream(jean_genealogy, buffer)
+    assert buffer.getvalue() == exporter.export_to_string(jean_genealogy).encode()
+
+    buffer.seek(0)
+    imported_genealogy = importer.import_from_stream(buffer)
+
+    imported_person = next(iter(imported_genealogy.persons.values()))
+    assert imported_person.birth_date.day == 15
+    assert imported_person.events[0].place == "Université de Paris"
+
+
+def test_import_interns_names_and_places(exporter, importer, jean_genealogy):
+    """Deux imports partagent les mêmes objets chaîne pour noms et lieux."""
+    content = exporter.export_to_string(jean_genealogy)
+    first = next(iter(importer.import_from_string(content).persons.values()))
+    second = next(iter(importer.import_from_string(content).persons.values()))
+
+    assert first.last_name is second.last_name
+    assert first.birth_place is second.birth_place
+    assert first.events[0].place is second.events[0].place
+
+
+def test_export_empty_genealogy(exporter):
+    """Test d'export d'une généalogie vide."""
+    with pytest.raises(ConversionError, match="La généalogie est vide"):
+        exporter.export_to_string(Genealogy())
+
+
+def test_export_invalid_genealogy(exporter):
+    """Test d'export d'un objet invalide."""
+    with pytest.raises(ConversionError, match="n'est pas une instance de Genealogy"):
+        exporter.export_to_string("invalid")
+
+
+def test_import_nonexistent_file(importer, fmt):
+    """Test d'import d'un fichier inexistant."""
+    with pytest.raises(ConversionError, match="Le fichier n'existe pas"):
+        importer.import_from_file(f"nonexistent.{fmt}")
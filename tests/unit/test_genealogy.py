@@ -5,6 +5,8 @@ Ces tests vérifient la création et manipulation de la généalogie
 et toutes ses méthodes de recherche et validation.
 """
 
+import sys
+
 import pytest
 
 from geneweb_py.core.date import Date
@@ -36,6 +38,12 @@ class TestGenealogyCreation:
         assert genealogy.metadata.encoding == "utf-8"
         assert genealogy.metadata.is_gwplus is True
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass(slots=True)")
+    def test_slots(self):
+        """Genealogy et GenealogyMetadata n'ont pas de __dict__ par instance"""
+        assert not hasattr(Genealogy(), "__dict__")
+        assert not hasattr(GenealogyMetadata(), "__dict__")
+
 
 class TestGenealogyAddPerson:
     """Tests pour l'ajout de personnes"""
@@ -69,6 +77,33 @@ class TestGenealogyAddPerson:
 
         assert "déjà présente" in str(exc_info.value)
 
+    def test_extend_persons(self):
+        """Test ajout de plusieurs personnes en une fois"""
+        genealogy = Genealogy()
+        persons = [
+            Person(last_name="CORNO", first_name="Joseph"),
+            Person(last_name="THOMAS", first_name="Marie"),
+        ]
+
+        genealogy.extend_persons(persons)
+
+        assert list(genealogy.persons) == ["CORNO_Joseph_0", "THOMAS_Marie_0"]
+        assert genealogy.get_statistics()["total_persons"] == 2
+
+    def test_extend_persons_duplicate_is_atomic(self):
+        """Un doublon dans le lot n'ajoute aucune personne"""
+        genealogy = Genealogy()
+        persons = [
+            Person(last_name="THOMAS", first_name="Marie"),
+            Person(last_name="CORNO", first_name="Joseph"),
+            Person(last_name="CORNO", first_name="Joseph"),  # Même ID
+        ]
+
+        with pytest.raises(GeneWebValidationError, match="déjà présente"):
+            genealogy.extend_persons(persons)
+
+        assert genealogy.persons == {}
+
 
 class TestGenealogyAddFamily:
     """Tests pour l'ajout de familles"""
@@ -99,6 +134,25 @@ class TestGenealogyAddFamily:
 
         assert "déjà présente" in str(exc_info.value)
 
+    def test_extend_families(self):
+        """Test ajout de plusieurs familles en une fois"""
+        genealogy = Genealogy()
+        genealogy.add_family(Family(family_id="FAM001"))
+
+        genealogy.extend_families([Family(family_id="FAM002"), Family("FAM003")])
+
+        assert list(genealogy.families) == ["FAM001", "FAM002", "FAM003"]
+
+    def test_extend_families_existing_is_atomic(self):
+        """Une famille déjà présente fait échouer tout le lot"""
+        genealogy = Genealogy()
+        genealogy.add_family(Family(family_id="FAM001"))
+
+        with pytest.raises(GeneWebValidationError, match="déjà présente"):
+            genealogy.extend_families([Family("FAM002"), Family("FAM001")])
+
+        assert list(genealogy.families) == ["FAM001"]
+
 
 class TestGenealogyFindMethods:
     """Tests pour les méthodes de recherche"""
@@ -256,6 +310,27 @@ class TestGenealogyRelations:
         sibling_names = {sibling.full_name for sibling in siblings}
         assert sibling_names == {"CORNO Sophie", "CORNO Paul"}
 
+    def test_iter_siblings(self):
+        """Test itération paresseuse des frères et sœurs"""
+        genealogy = Genealogy()
+        genealogy.extend_persons(
+            [
+                Person(last_name="CORNO", first_name="Jean"),
+                Person(last_name="CORNO", first_name="Sophie"),
+            ]
+        )
+        family = Family(family_id="FAM001", husband_id="CORNO_Joseph_0")
+        family.add_child("CORNO_Jean_0")
+        family.add_child("CORNO_Absent_0")  # Absent de la généalogie
+        family.add_child("CORNO_Sophie_0")
+        genealogy.add_family(family)
+
+        siblings = genealogy.iter_siblings("CORNO_Jean_0")
+
+        assert not isinstance(siblings, list)
+        assert [s.first_name for s in siblings] == ["Sophie"]
+        assert list(genealogy.iter_siblings("CORNO_Joseph_0")) == []
+
     def test_get_spouses(self):
         """Test récupération des conjoints"""
         genealogy = Genealogy()
@@ -286,6 +361,22 @@ class TestGenealogyRelations:
         spouse_names = {spouse.full_name for spouse in spouses}
         assert spouse_names == {"THOMAS Marie", "DUPONT Claire"}
 
+    def test_get_spouses_ignores_child_and_single_parent_families(self):
+        """Les familles sans conjoint ou où la personne est enfant sont ignorées"""
+        genealogy = Genealogy()
+        genealogy.extend_persons(
+            [
+                Person(last_name="CORNO", first_name="Joseph"),
+                Person(last_name="CORNO", first_name="Pierre"),
+            ]
+        )
+        single = Family(family_id="FAM001", husband_id="CORNO_Joseph_0")
+        parents = Family(family_id="FAM002", husband_id="CORNO_Pierre_0")
+        parents.add_child("CORNO_Joseph_0")
+        genealogy.extend_families([single, parents])
+
+        assert genealogy.get_spouses("CORNO_Joseph_0") == []
+
 
 class TestGenealogyValidation:
     """Tests pour la validation de cohérence"""
@@ -431,6 +522,38 @@ class TestGenealogyStatistics:
         assert stats["persons_with_birth_date"] == 0
         assert stats["persons_with_death_date"] == 1
 
+    def test_get_statistics_ages_and_children(self):
+        """Test des agrégats d'âge au décès et d'enfants"""
+        genealogy = Genealogy()
+        genealogy.extend_persons(
+            [
+                Person(
+                    last_name="CORNO",
+                    first_name="Joseph",
+                    birth_date=Date(year=1900),
+                    death_date=Date(year=1980),
+                ),
+                Person(
+                    last_name="THOMAS",
+                    first_name="Marie",
+                    birth_date=Date(year=1905),
+                    death_date=Date(year=1965),
+                ),
+            ]
+        )
+        family = Family(family_id="FAM001", husband_id="CORNO_Joseph_0")
+        family.add_child("CORNO_Jean_0")
+        family.add_child("CORNO_Pierre_0")
+        genealogy.extend_families([family, Family(family_id="FAM002")])
+
+        stats = genealogy.get_statistics()
+
+        assert stats["average_age_at_death"] == 70
+        assert stats["oldest_death"] == 80
+        assert stats["youngest_death"] == 60
+        assert stats["families_with_children"] == 1
+        assert stats["total_children"] == 2
+
     def test_statistics_cache(self):
         """Test mise en cache des statistiques"""
         genealogy = Genealogy()
@@ -488,6 +611,45 @@ class TestGenealogyCrossReferences:
         assert "FAM001" in mother.families_as_spouse
         assert "FAM001" in child.families_as_child
 
+    def test_add_family_links_members(self):
+        """add_family relie les membres présents sans reconstruction complète"""
+        genealogy = Genealogy()
+        father = Person(last_name="CORNO", first_name="Joseph")
+        child = Person(last_name="CORNO", first_name="Jean")
+        genealogy.extend_persons([father, child])
+
+        family = Family(
+            family_id="FAM001", husband_id="CORNO_Joseph_0", wife_id="THOMAS_Marie_0"
+        )
+        family.add_child("CORNO_Jean_0")
+        genealogy.add_family(family)
+        genealogy.extend_families(
+            [Family(family_id="FAM002", husband_id="CORNO_Joseph_0")]
+        )
+
+        assert father.families_as_spouse == ["FAM001", "FAM002"]
+        assert child.families_as_child == ["FAM001"]
+
+        # La reconstruction complète ne duplique pas les références
+        genealogy._update_cross_references()
+        assert father.families_as_spouse == ["FAM001", "FAM002"]
+
+    def test_ids_shared_with_person_keys(self):
+        """Les identifiants des familles sont les objets clés de persons"""
+        genealogy = Genealogy()
+        father = Person(last_name="CORNO", first_name="Joseph")
+        child = Person(last_name="CORNO", first_name="Jean")
+        genealogy.extend_persons([father, child])
+
+        # unique_id construit une nouvelle chaîne à chaque appel
+        family = Family(family_id="FAM001", husband_id=father.unique_id)
+        family.add_child(child.unique_id)
+        genealogy.add_family(family)
+
+        keys = {key: key for key in genealogy.persons}
+        assert family.husband_id is keys[father.unique_id]
+        assert family.children[0].person_id is keys[child.unique_id]
+
 
 class TestGenealogySerialization:
     """Tests pour la sérialisation"""
@@ -5,6 +5,8 @@ Ces tests vérifient que le système de validation peut détecter et rapporter
 plusieurs erreurs au lieu de s'arrêter à la première.
 """
 
+import re
+
 import pytest
 
 from geneweb_py.core.date import Date
@@ -12,7 +14,7 @@ from geneweb_py.core.exceptions import (
     ErrorSeverity,
     GeneWebValidationError,
 )
-from geneweb_py.core.family import Family
+from geneweb_py.core.family import Child, ChildSex, Family
 from geneweb_py.core.genealogy import Genealogy
 from geneweb_py.core.person import Gender, Person
 from geneweb_py.core.validation import (
@@ -28,6 +30,15 @@ from geneweb_py.core.validation import (
 )
 
 
+def _has_error(errors, pattern):
+    """Indique si un message d'erreur correspond au motif regex
+
+    Les messages sont joints une seule fois par des sauts de ligne : ``.`` ne
+    les traversant pas, un motif ``a.*b`` reste limité à un même message.
+    """
+    return re.search(pattern, "\n".join(map(str, errors))) is not None
+
+
 class TestValidationContext:
     """Tests pour le contexte de validation"""
 
@@ -96,7 +107,7 @@ class TestPersonValidation:
         result = validate_person_basic(person)
         assert not result.is_valid()
         assert len(result.errors) > 0
-        assert any("nom de famille" in str(e).lower() for e in result.errors)
+        assert _has_error(result.errors, "(?i)nom de famille")
 
     def test_person_missing_first_name(self):
         """Test de personne sans prénom"""
@@ -106,7 +117,7 @@ class TestPersonValidation:
 
         result = validate_person_basic(person)
         assert not result.is_valid()
-        assert any("prénom" in str(e).lower() for e in result.errors)
+        assert _has_error(result.errors, "(?i)prénom")
 
     def test_person_birth_after_death(self):
         """Test de personne née après son décès"""
@@ -121,7 +132,7 @@ class TestPersonValidation:
 
         result = validate_person_basic(person)
         assert not result.is_valid()
-        assert any("postérieure" in str(e).lower() for e in result.errors)
+        assert _has_error(result.errors, "(?i)postérieure")
 
     def test_person_baptism_before_birth(self):
         """Test de baptême avant naissance"""
@@ -136,10 +147,7 @@ class TestPersonValidation:
 
         result = validate_person_basic(person)
         assert not result.is_valid()
-        assert any(
-            "baptême" in str(e).lower() and "antérieure" in str(e).lower()
-            for e in result.errors
-        )
+        assert _has_error(result.errors, "(?i)baptême.*antérieure")
 
     def test_person_deceased_without_death_date(self):
         """Test de personne décédée sans date de décès (avertissement)"""
@@ -195,10 +203,7 @@ class TestFamilyValidation:
 
         result = validate_family_basic(family)
         assert not result.is_valid()
-        assert any(
-            "mariage" in str(e).lower() and "divorce" in str(e).lower()
-            for e in result.errors
-        )
+        assert _has_error(result.errors, "(?i)mariage.*divorce")
 
     def test_family_divorce_date_without_is_separated(self):
         """Test de date de divorce sans is_separated"""
@@ -267,12 +272,10 @@ class TestFamilyMembersValidation:
 
         result = validate_family_members(family, genealogy)
         assert not result.is_valid()
-        assert any("Époux" in str(e) and "non trouvé" in str(e) for e in result.errors)
+        assert _has_error(result.errors, "Époux.*non trouvé")
 
     def test_family_missing_child(self):
         """Test d'enfant manquant"""
-        from geneweb_py.core.family import Child, ChildSex
-
         genealogy = Genealogy()
 
         husband = Person(
@@ -290,7 +293,7 @@ class TestFamilyMembersValidation:
 
         result = validate_family_members(family, genealogy)
         assert not result.is_valid()
-        assert any("Enfant" in str(e) and "non trouvé" in str(e) for e in result.errors)
+        assert _has_error(result.errors, "Enfant.*non trouvé")
 
 
 class TestGenealogyValidation:
@@ -520,7 +523,6 @@ class TestBidirectionalValidation:
             husband_id=father.unique_id,
             wife_id=mother.unique_id,
         )
-        from geneweb_py.core.family import Child
 
         family.children.append(Child(person_id=child.unique_id))
 
@@ -535,6 +537,8 @@ class TestBidirectionalValidation:
         genealogy.add_person(mother)
         genealogy.add_person(child)
         genealogy.add_family(family)
+        # add_family relie l'enfant : retirer ce lien pour le scénario
+        child.families_as_child.clear()
 
         # Valider les références bidirectionnelles sans contexte (teste ligne 348)
         result = validate_bidirectional_references(genealogy)
@@ -8,13 +8,25 @@ from pathlib import Path
 import pytest
 
 from geneweb_py.core.date import CalendarType, Date, DatePrefix
-from geneweb_py.core.event import Event, EventType, FamilyEventType
+from geneweb_py.core.event import Event, EventType, FamilyEvent, FamilyEventType
 from geneweb_py.core.family import Family
 from geneweb_py.core.genealogy import Genealogy
 from geneweb_py.core.person import Gender, Person
 from geneweb_py.formats.xml import ConversionError, XMLExporter, XMLImporter
 
 
+@pytest.fixture(scope="module")
+def exporter():
+    """Exporteur XML sans état, partagé par les tests du module"""
+    return XMLExporter()
+
+
+@pytest.fixture(scope="module")
+def importer():
+    """Importeur XML partagé (table d'identifiants remise à zéro à chaque import)"""
+    return XMLImporter()
+
+
 class TestXMLExporter:
     """Tests pour la classe XMLExporter."""
 
@@ -24,9 +36,8 @@ class TestXMLExporter:
         assert exporter.encoding == "utf-8"
         assert exporter.pretty_print is True
 
-    def test_export_to_string_simple(self):
+    def test_export_to_string_simple(self, exporter):
         """Test d'export vers chaîne simple."""
-        exporter = XMLExporter()
         genealogy = Genealogy()
 
         person = Person(last_name="DUPONT", first_name="Jean", gender=Gender.MALE)
@@ -48,9 +59,8 @@ class TestXMLExporter:
         assert person_elem.get("first_name") == "Jean"
         assert person_elem.get("gender") == "m"
 
-    def test_export_to_string_with_dates(self):
+    def test_export_to_etree_with_dates(self, exporter):
         """Test d'export avec des dates."""
-        exporter = XMLExporter()
         genealogy = Genealogy()
 
         person = Person(
@@ -61,8 +71,7 @@ class TestXMLExporter:
         )
         genealogy.add_person(person)
 
-        result = exporter.export_to_string(genealogy)
-        root = ET.fromstring(result)
+        root = exporter.export_to_etree(genealogy)
 
         person_elem = root.find("persons/person")
         birth_elem = person_elem.find("birth")
@@ -78,18 +87,15 @@ class TestXMLExporter:
         assert death_elem.get("month") == "12"
         assert death_elem.get("day") == "25"
 
-    def test_export_to_string_with_family(self):
+    def test_export_to_etree_with_family(self, exporter):
         """Test d'export avec une famille."""
-        exporter = XMLExporter()
         genealogy = Genealogy()
 
         husband = Person(last_name="DUPONT", first_name="Jean", gender=Gender.MALE)
         wife = Person(last_name="MARTIN", first_name="Marie", gender=Gender.FEMALE)
         child = Person(last_name="DUPONT", first_name="Pierre", gender=Gender.MALE)
 
-        genealogy.add_person(husband)
-        genealogy.add_person(wife)
-        genealogy.add_person(child)
+        genealogy.extend_persons([husband, wife, child])
 
         family = Family(
             family_id="FAM001", husband_id=husband.unique_id, wife_id=wife.unique_id
@@ -97,8 +103,7 @@ class TestXMLExporter:
         family.add_child(child.unique_id)
         genealogy.add_family(family)
 
-        result = exporter.export_to_string(genealogy)
-        root = ET.fromstring(result)
+        root = exporter.export_to_etree(genealogy)
 
         persons_elem = root.find("persons")
         families_elem = root.find("families")
@@ -114,9 +119,8 @@ class TestXMLExporter:
         assert children_elem is not None
         assert len(children_elem.findall("child")) == 1
 
-    def test_export_to_string_with_events(self):
+    def test_export_to_etree_with_events(self, exporter):
         """Test d'export avec des événements."""
-        exporter = XMLExporter()
         genealogy = Genealogy()
 
         person = Person(last_name="DUPONT", first_name="Jean")
@@ -129,8 +133,7 @@ class TestXMLExporter:
         person.add_event(event)
         genealogy.add_person(person)
 
-        result = exporter.export_to_string(genealogy)
-        root = ET.fromstring(result)
+        root = exporter.export_to_etree(genealogy)
 
         person_elem = root.find("persons/person")
         events_elem = person_elem.find("events")
@@ -146,43 +149,33 @@ class TestXMLExporter:
         note_elem = notes_elem.find("note")
         assert note_elem.text == "Diplôme d'ingénieur"
 
-    def test_export_to_file(self):
+    def test_export_to_file(self, exporter, tmp_path: Path):
         """Test d'export vers fichier."""
-        exporter = XMLExporter()
         genealogy = Genealogy()
 
         person = Person(last_name="DUPONT", first_name="Jean")
         genealogy.add_person(person)
 
-        temp_file = Path("temp_test.xml")
+        temp_file = tmp_path / "temp_test.xml"
+        exporter.export(genealogy, str(temp_file))
+        assert temp_file.exists()
 
-        try:
-            exporter.export(genealogy, str(temp_file))
-            assert temp_file.exists()
-
-            # Vérifier le contenu
-            root = ET.parse(str(temp_file)).getroot()
-            assert root.tag == "genealogy"
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        # Vérifier le contenu
+        root = ET.parse(str(temp_file)).getroot()
+        assert root.tag == "genealogy"
 
-    def test_export_empty_genealogy(self):
-        """Test d'export d'une généalogie vide."""
-        exporter = XMLExporter()
+    @pytest.mark.parametrize("pretty_print", [True, False])
+    def test_export_to_file_matches_string(self, tmp_path: Path, pretty_print):
+        """Le fichier écrit est identique à export_to_string."""
+        exporter = XMLExporter(pretty_print=pretty_print)
         genealogy = Genealogy()
+        genealogy.add_person(Person(last_name="LÉVÊQUE", first_name="Hélène"))
 
-        with pytest.raises(ConversionError, match="La généalogie est vide"):
-            exporter.export_to_string(genealogy)
-
-    def test_export_invalid_genealogy(self):
-        """Test d'export d'un objet invalide."""
-        exporter = XMLExporter()
+        temp_file = tmp_path / "temp_test.xml"
+        exporter.export(genealogy, temp_file)
 
-        with pytest.raises(
-            ConversionError, match="n'est pas une instance de Genealogy"
-        ):
-            exporter.export_to_string("invalid")
+        expected = exporter.export_to_string(genealogy)
+        assert temp_file.read_text(encoding="utf-8") == expected
 
 
 class TestXMLImporter:
@@ -193,7 +186,7 @@ class TestXMLImporter:
         importer = XMLImporter(encoding="utf-8")
         assert importer.encoding == "utf-8"
 
-    def test_import_complete_family(self, tmp_path):
+    def test_import_complete_family(self, importer, tmp_path):
         """Test import famille complète avec tous attributs."""
         xml_content = """<?xml version="1.0" encoding="UTF-8"?>
 <genealogy version="1.0.0">
@@ -223,11 +216,10 @@ class TestXMLImporter:
         xml_file = tmp_path / "family.xml"
         xml_file.write_text(xml_content, encoding="utf-8")
 
-        importer = XMLImporter()
         genealogy = importer.import_from_file(str(xml_file))
 
         assert len(genealogy.families) >= 1
-        family = list(genealogy.families.values())[0]
+        family = next(iter(genealogy.families.values()))
         assert family.husband_id == "Dupont_Jean_0"
         assert family.wife_id == "Martin_Marie_0"
         assert family.marriage_date is not None
@@ -239,7 +231,7 @@ class TestXMLImporter:
         assert len(family.events) == 1
         assert family.events[0].family_event_type == FamilyEventType.MARRIAGE
 
-    def test_import_family_with_divorce(self, tmp_path):
+    def test_import_family_with_divorce(self, importer, tmp_path):
         """Test import famille avec divorce."""
         xml_content = """<?xml version="1.0" encoding="UTF-8"?>
 <genealogy version="1.0.0">
@@ -258,14 +250,13 @@ class TestXMLImporter:
         xml_file = tmp_path / "divorce.xml"
         xml_file.write_text(xml_content, encoding="utf-8")
 
-        importer = XMLImporter()
         genealogy = importer.import_from_file(str(xml_file))
 
-        family = list(genealogy.families.values())[0]
+        family = next(iter(genealogy.families.values()))
         assert family.divorce_date is not None
         assert family.divorce_date.year == 1985
 
-    def test_import_event_with_all_fields(self, tmp_path):
+    def test_import_event_with_all_fields(self, importer, tmp_path):
         """Test import événement avec tous les champs."""
         xml_content = """<?xml version="1.0" encoding="UTF-8"?>
 <genealogy version="1.0.0">
@@ -293,10 +284,9 @@ class TestXMLImporter:
         xml_file = tmp_path / "event.xml"
         xml_file.write_text(xml_content, encoding="utf-8")
 
-        importer = XMLImporter()
         genealogy = importer.import_from_file(str(xml_file))
 
-        person = list(genealogy.persons.values())[0]
+        person = next(iter(genealogy.persons.values()))
         assert len(person.events) == 1
         evt = person.events[0]
         assert evt.event_type == EventType.BIRTH
@@ -309,7 +299,7 @@ class TestXMLImporter:
         assert evt.witnesses[0]["person_id"] == "Témoin 1"
         assert evt.notes == ["Note 1", "Note 2"]
 
-    def test_import_date_with_prefix(self, tmp_path):
+    def test_import_date_with_prefix(self, importer, tmp_path):
         """Test import date avec préfixe."""
         xml_content = """<?xml version="1.0" encoding="UTF-8"?>
 <genealogy version="1.0.0">
@@ -324,12 +314,11 @@ class TestXMLImporter:
         xml_file = tmp_path / "date_prefix.xml"
         xml_file.write_text(xml_content, encoding="utf-8")
 
-        importer = XMLImporter()
         genealogy = importer.import_from_file(str(xml_file))
 
         assert len(genealogy.persons) >= 1
 
-    def test_import_date_with_calendar(self, tmp_path):
+    def test_import_date_with_calendar(self, importer, tmp_path):
         """Test import date avec calendrier."""
         xml_content = """<?xml version="1.0" encoding="UTF-8"?>
 <genealogy version="1.0.0">
@@ -344,15 +333,14 @@ class TestXMLImporter:
         xml_file = tmp_path / "date_calendar.xml"
         xml_file.write_text(xml_content, encoding="utf-8")
 
-        importer = XMLImporter()
         genealogy = importer.import_from_file(str(xml_file))
 
         assert len(genealogy.persons) >= 1
-        person = list(genealogy.persons.values())[0]
+        person = next(iter(genealogy.persons.values()))
         assert person.birth_date is not None
         assert person.birth_date.calendar == CalendarType.JULIAN
 
-    def test_import_event_without_type(self, tmp_path):
+    def test_import_event_without_type(self, importer, tmp_path):
         """Test import événement sans type spécifié."""
         xml_content = """<?xml version="1.0" encoding="UTF-8"?>
 <genealogy version="1.0.0">
@@ -371,18 +359,30 @@ class TestXMLImporter:
         xml_file = tmp_path / "event_no_type.xml"
         xml_file.write_text(xml_content, encoding="utf-8")
 
-        importer = XMLImporter()
         genealogy = importer.import_from_file(str(xml_file))
 
-        person = list(genealogy.persons.values())[0]
+        person = next(iter(genealogy.persons.values()))
         assert len(person.events) == 1
         assert person.events[0].event_type == EventType.OTHER
         assert person.events[0].place == "Paris"
 
-    def test_import_from_string_simple(self):
-        """Test d'import depuis chaîne simple."""
-        importer = XMLImporter()
+    @pytest.mark.parametrize(
+        ("code", "expected"),
+        [("grad", EventType.GRADUATION), ("inconnu", EventType.OTHER)],
+    )
+    def test_import_event_type_code(self, importer, code, expected):
+        """Les codes d'événement connus sont résolus, les autres donnent OTHER."""
+        xml_content = f"""<genealogy><persons>
+<person last_name="Test" first_name="Person"><events><event type="{code}"/></events>
+</person></persons></genealogy>"""
+
+        genealogy = importer.import_from_string(xml_content)
+
+        person = next(iter(genealogy.persons.values()))
+        assert person.events[0].event_type == expected
 
+    def test_import_from_string_simple(self, importer):
+        """Test d'import depuis chaîne simple."""
         xml_string = """<?xml version="1.0" encoding="utf-8"?>
         <genealogy version="1.0.0" format="geneweb-py-xml">
             <metadata>
@@ -397,15 +397,13 @@ class TestXMLImporter:
         genealogy = importer.import_from_string(xml_string)
 
         assert len(genealogy.persons) == 1
-        person = list(genealogy.persons.values())[0]
+        person = next(iter(genealogy.persons.values()))
         assert person.last_name == "DUPONT"
         assert person.first_name == "Jean"
         assert person.gender == Gender.MALE
 
-    def test_import_from_string_with_dates(self):
+    def test_import_from_string_with_dates(self, importer):
         """Test d'import avec des dates."""
-        importer = XMLImporter()
-
         xml_string = """<?xml version="1.0" encoding="utf-8"?>
         <genealogy version="1.0.0" format="geneweb-py-xml">
             <metadata>
@@ -422,7 +420,7 @@ class TestXMLImporter:
 
         genealogy = importer.import_from_string(xml_string)
 
-        person = list(genealogy.persons.values())[0]
+        person = next(iter(genealogy.persons.values()))
         assert person.birth_date.year == 1950
         assert person.birth_date.month == 3
         assert person.birth_date.day == 15
@@ -430,10 +428,8 @@ class TestXMLImporter:
         assert person.death_date.month == 12
         assert person.death_date.day == 25
 
-    def test_import_from_string_with_events(self):
+    def test_import_from_string_with_events(self, importer):
         """Test d'import avec des événements."""
-        importer = XMLImporter()
-
         xml_string = """<?xml version="1.0" encoding="utf-8"?>
         <genealogy version="1.0.0" format="geneweb-py-xml">
             <metadata>
@@ -457,7 +453,7 @@ class TestXMLImporter:
 
         genealogy = importer.import_from_string(xml_string)
 
-        person = list(genealogy.persons.values())[0]
+        person = next(iter(genealogy.persons.values()))
         assert len(person.events) == 1
         event = person.events[0]
         assert event.event_type == EventType.GRADUATION
@@ -466,10 +462,8 @@ class TestXMLImporter:
         assert event.date.year == 1972
         assert event.date.month == 6
 
-    def test_import_from_file(self):
+    def test_import_from_file(self, importer, tmp_path: Path):
         """Test d'import depuis fichier."""
-        importer = XMLImporter()
-
         xml_string = """<?xml version="1.0" encoding="utf-8"?>
         <genealogy version="1.0.0" format="geneweb-py-xml">
             <metadata>
@@ -481,76 +475,36 @@ class TestXMLImporter:
             <families/>
         </genealogy>"""
 
-        temp_file = Path("temp_test.xml")
-
-        try:
-            with open(temp_file, "w", encoding="utf-8") as f:
-                f.write(xml_string)
-
-            genealogy = importer.import_from_file(str(temp_file))
-            assert len(genealogy.persons) == 1
-            assert list(genealogy.persons.values())[0].last_name == "DUPONT"
-        finally:
-            if temp_file.exists():
-                temp_file.unlink()
+        temp_file = tmp_path / "temp_test.xml"
+        temp_file.write_text(xml_string, encoding="utf-8")
 
-    def test_import_invalid_xml(self):
-        """Test d'import de XML invalide."""
-        importer = XMLImporter()
+        genealogy = importer.import_from_file(str(temp_file))
+        assert len(genealogy.persons) == 1
+        assert next(iter(genealogy.persons.values())).last_name == "DUPONT"
 
-        with pytest.raises(ConversionError, match="Erreur lors du parsing XML"):
+    def test_import_invalid_xml(self, importer):
+        """Test d'import de XML invalide (rejeté dès le premier caractère)."""
+        with pytest.raises(ConversionError, match="ne commence pas par"):
             importer.import_from_string("invalid xml")
 
-    def test_import_nonexistent_file(self):
-        """Test d'import d'un fichier inexistant."""
-        importer = XMLImporter()
-
-        with pytest.raises(ConversionError, match="Le fichier n'existe pas"):
-            importer.import_from_file("nonexistent.xml")
-
-    def test_roundtrip_export_import(self):
-        """Test d'export puis import (roundtrip)."""
-        # Créer une généalogie
-        genealogy = Genealogy()
-        person = Person(
-            last_name="DUPONT",
-            first_name="Jean",
-            gender=Gender.MALE,
-            birth_date=Date(year=1950, month=3, day=15),
-            birth_place="Paris, France",
-        )
-        event = Event(
-            event_type=EventType.GRADUATION,
-            date=Date(year=1972, month=6),
-            place="Université de Paris",
-            notes=["Diplôme d'ingénieur"],
-        )
-        person.add_event(event)
-        genealogy.add_person(person)
+    def test_import_malformed_xml(self, importer):
+        """Un document tronqué passe le contrôle initial et échoue au parsing."""
+        with pytest.raises(ConversionError, match="Erreur lors du parsing XML"):
+            importer.import_from_string("\n<genealogy><persons>")
+
+    def test_import_rejects_entity_declarations(self, importer):
+        """Les DTD avec entités sont refusées (defusedxml)."""
+        pytest.importorskip("defusedxml")
+        xml_content = """<?xml version="1.0"?>
+<!DOCTYPE genealogy [<!ENTITY nom "DUPONT">]>
+<genealogy><persons><person last_name="&nom;" first_name="Jean"/></persons>
+</genealogy>"""
 
-        # Exporter
-        exporter = XMLExporter()
-        xml_string = exporter.export_to_string(genealogy)
+        with pytest.raises(ConversionError, match="Erreur lors du parsing XML"):
+            importer.import_from_string(xml_content)
 
-        # Importer
-        importer = XMLImporter()
-        imported_genealogy = importer.import_from_string(xml_string)
-
-        # Vérifier que les données sont identiques
-        assert len(imported_genealogy.persons) == 1
-        imported_person = list(imported_genealogy.persons.values())[0]
-        assert imported_person.last_name == "DUPONT"
-        assert imported_person.first_name == "Jean"
-        assert imported_person.gender == Gender.MALE
-        assert imported_person.birth_date.year == 1950
-        assert imported_person.birth_place == "Paris, France"
-        assert len(imported_person.events) == 1
-        assert imported_person.events[0].event_type == EventType.GRADUATION
-
-    def test_roundtrip_export_import_person_family_event(self):
+    def test_roundtrip_export_import_person_family_event(self, exporter, importer):
         """Export XML puis import : Person, Family et événement familial cohérents."""
-        from geneweb_py.core.event import FamilyEvent, FamilyEventType
-
         genealogy = Genealogy()
         husband = Person(last_name="DUPONT", first_name="Jean", gender=Gender.MALE)
         wife = Person(last_name="MARTIN", first_name="Marie", gender=Gender.FEMALE)
@@ -575,15 +529,15 @@ class TestXMLImporter:
         family.add_event(fe)
         genealogy.add_family(family)
 
-        xml_string = XMLExporter().export_to_string(genealogy)
-        imported = XMLImporter().import_from_string(xml_string)
+        xml_string = exporter.export_to_string(genealogy)
+        imported = importer.import_from_string(xml_string)
 
         assert len(imported.persons) == 2
         assert len(imported.families) == 1
         imp_h = imported.find_person_by_id(husband.unique_id)
         imp_w = imported.find_person_by_id(wife.unique_id)
         assert imp_h is not None and imp_w is not None
-        fam = list(imported.families.values())[0]
+        fam = next(iter(imported.families.values()))
         assert fam.family_id == "fam_rt_1"
         assert fam.husband_id == husband.unique_id
         assert fam.wife_id == wife.unique_id